@@ -1,19 +1,40 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory, make_response, redirect, url_for, abort
+from flask import Flask, request, jsonify, render_template, send_from_directory, make_response, redirect, url_for, abort, Response
 from flask_cors import CORS  # Import Flask-CORS
 from flask_compress import Compress
+from flask_caching import Cache
+from flask.json.provider import JSONProvider
+from werkzeug.http import generate_etag
+import orjson
 import pandas as pd
-import joblib
+import numpy as np
 import os
+import re
+import gzip
+import threading
 from datetime import datetime, timedelta
-import warnings
+from functools import lru_cache
 
-# Suppress joblib multiprocessing warnings in serverless environment
-warnings.filterwarnings('ignore', message='.*joblib will operate in serial mode.*')
-os.environ['JOBLIB_MULTIPROCESSING'] = '0'
+ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+class OrjsonProvider(JSONProvider):
+    """Serialize jsonify() responses with orjson instead of the stdlib encoder"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
 
 app = Flask(__name__, template_folder="templates")  # Specify the folder for HTML templates
+app.json = OrjsonProvider(app)  # Fast JSON serialization for all API responses
 CORS(app)  # Enable CORS to allow cross-origin requests
+# Flask-Compress leaves gzip out of streamed responses by default
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['zstd', 'br', 'gzip', 'deflate']
 Compress(app)  # Enable Gzip compression for better performance
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache'})  # In-process response cache
 
 # Production domain configuration
 PRODUCTION_DOMAIN = 'freemoviesearcher.tech'
@@ -44,6 +65,28 @@ def redirect_to_canonical():
     
     return None
 
+# Cache-Control values, looked up by exact path first and then by the first
+# path segment
+API_CACHE_CONTROL = 'public, max-age=3600, s-maxage=7200, stale-while-revalidate=86400'
+CACHE_CONTROL_BY_PATH = {
+    # Cache sitemap/robots for 1 day
+    '/sitemap.xml': 'public, max-age=86400, s-maxage=172800',
+    '/robots.txt': 'public, max-age=86400, s-maxage=172800',
+    '/ads.txt': 'public, max-age=86400, s-maxage=172800',
+}
+CACHE_CONTROL_BY_SEGMENT = {
+    # Cache static files for 1 year
+    'static': 'public, max-age=31536000, immutable',
+    # Cache API responses for 1 hour
+    'recommend': API_CACHE_CONTROL,
+    'search': API_CACHE_CONTROL,
+    'popular': API_CACHE_CONTROL,
+    'genres': API_CACHE_CONTROL,
+    'genre': API_CACHE_CONTROL,
+}
+# Don't cache HTML pages (for SEO updates)
+DEFAULT_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
 # Performance optimization: Add caching headers
 @app.after_request
 def add_cache_headers(response):
@@ -58,33 +101,37 @@ def add_cache_headers(response):
     # Allow images from all sources for blog images
     response.headers['Content-Security-Policy'] = "default-src 'self'; img-src * data: blob: https:; script-src 'self' 'unsafe-inline' 'unsafe-eval' https://cdnjs.cloudflare.com https://www.google-analytics.com; style-src 'self' 'unsafe-inline' https://cdnjs.cloudflare.com; font-src 'self' https://cdnjs.cloudflare.com; connect-src 'self' https://image.tmdb.org;"
     
-    # Cache static files for 1 year
-    if request.path.startswith('/static/'):
-        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
-    # Cache API responses for 1 hour
-    elif request.path.startswith(('/recommend', '/search', '/popular', '/genres', '/genre/')):
-        response.headers['Cache-Control'] = 'public, max-age=3600, s-maxage=7200, stale-while-revalidate=86400'
-    # Cache sitemap/robots for 1 day
-    elif request.path in ['/sitemap.xml', '/robots.txt', '/ads.txt']:
-        response.headers['Cache-Control'] = 'public, max-age=86400, s-maxage=172800'
-    # Don't cache HTML pages (for SEO updates)
-    else:
-        response.headers['Cache-Control'] = 'public, max-age=0, must-revalidate'
+    path = request.path
+    cache_control = CACHE_CONTROL_BY_PATH.get(path)
+    if cache_control is None:
+        cache_control = CACHE_CONTROL_BY_SEGMENT.get(path.split('/', 2)[1], DEFAULT_CACHE_CONTROL)
+    response.headers['Cache-Control'] = cache_control
     
     # Add compression hint
     response.headers['Vary'] = 'Accept-Encoding'
     
-    # Add ETag for better caching
-    if not response.headers.get('ETag'):
-        response.add_etag()
+    # Add ETag for better caching (streamed bodies are not buffered to hash them)
+    # and answer a matching If-None-Match with 304 Not Modified
+    if not response.is_streamed and response.status_code == 200:
+        if not response.headers.get('ETag'):
+            response.add_etag()
+        response.make_conditional(request)
     
     return response
 
 BASE_POSTER_URL = "https://image.tmdb.org/t/p/w500"
 
+# Characters stripped from titles before fuzzy matching
+PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Columns of movies_with_posters.csv the app uses; the rest are not loaded
+DATASET_COLUMNS = ['Title', 'Director', 'Cast', 'poster_path', 'genres', 'overview']
+
 # Load dataset
 try:
-    data = pd.read_csv('movies_with_posters.csv')
+    # Header read on its own so /stats keeps listing every column in the file
+    DATASET_FILE_COLUMNS = pd.read_csv('movies_with_posters.csv', nrows=0).columns.tolist()
+    data = pd.read_csv('movies_with_posters.csv', usecols=lambda column: column in DATASET_COLUMNS)
     print("Dataset loaded successfully!")
 except FileNotFoundError:
     print("Error: movies_with_posters.csv not found.")
@@ -92,15 +139,203 @@ except FileNotFoundError:
 
 if data is not None and 'Title' in data.columns:
     data['Title'] = data['Title'].str.strip().str.lower()
+    # Contiguous array of lowercased titles so per-request scans run in a
+    # single NumPy C loop. Titles are case-folded here once; callers lowercase
+    # the needle and scan with literal, case-sensitive matching (no regex).
+    TITLES = data['Title'].to_numpy(dtype=str)
+    # Titles with punctuation removed, used by the fuzzy recommendation fallback
+    TITLES_CLEAN = np.array([PUNCTUATION_RE.sub('', t).strip() for t in TITLES.tolist()], dtype=str)
+    # Response-ready display columns, formatted once at load so request
+    # handlers only select rows (same index as data)
+    display_data = pd.DataFrame({
+        'Title': data['Title'].str.title(),
+        'Director': data['Director'].fillna('Unknown'),
+        'Cast': data['Cast'].fillna('Unknown'),
+        'poster_path': BASE_POSTER_URL + data['poster_path'].fillna(''),
+        'genres': data['genres'].fillna('Unknown'),
+        'overview': data['overview'].fillna('No overview available'),
+    })
 else:
     print("Error: Dataset is invalid or missing 'Title' column.")
-
-# Load similarity matrix
+    TITLES = np.array([], dtype=str)
+    TITLES_CLEAN = np.array([], dtype=str)
+    display_data = None
+
+# First row of each lowercased title, for O(1) exact-match lookups
+TITLE_TO_IDX = {}
+for row, movie_title in enumerate(TITLES.tolist()):
+    TITLE_TO_IDX.setdefault(movie_title, row)
+
+# First row of each cleaned title, so "cleaned title inside the query" can be
+# answered by hashing the query's substrings instead of scanning every title
+CLEAN_TITLE_ROWS = {}
+for row, clean_title in enumerate(TITLES_CLEAN.tolist()):
+    CLEAN_TITLE_ROWS.setdefault(clean_title, row)
+MAX_CLEAN_TITLE_LEN = max(map(len, CLEAN_TITLE_ROWS), default=0)
+
+# Longer /recommend titles are rejected up front: matching a query costs time
+# proportional to its length, and no real title comes anywhere near this
+MAX_TITLE_QUERY_LEN = 4 * max(MAX_CLEAN_TITLE_LEN, 64)
+
+# One ready-to-serialize dict per row, so responses skip DataFrame.to_dict()
+DISPLAY_RECORDS = display_data.to_dict(orient='records') if display_data is not None else []
+
+# Title-cased titles by row, for autocomplete suggestions
+TITLES_DISPLAY = display_data['Title'].to_numpy(dtype=object) if display_data is not None else np.array([], dtype=object)
+
+# API records for the given display_data rows
+def movie_records(rows):
+    return [DISPLAY_RECORDS[i] for i in rows]
+
+# Record lists longer than this are streamed instead of encoded in one piece
+STREAM_THRESHOLD = 200
+STREAM_BATCH_SIZE = 100
+
+# JSON array response; large lists are streamed in batches of records so the
+# full JSON document is never held in memory at once. Only the uncached
+# /popular view streams: a streamed body skips the response cache and ETag.
+def records_response(records):
+    if len(records) <= STREAM_THRESHOLD:
+        return jsonify(records)
+    
+    def generate():
+        yield b'['
+        for start in range(0, len(records), STREAM_BATCH_SIZE):
+            batch = b','.join(orjson.dumps(r, option=ORJSON_OPTIONS) for r in records[start:start + STREAM_BATCH_SIZE])
+            yield (b',' if start else b'') + batch
+        yield b']'
+    
+    return Response(generate(), mimetype='application/json')
+
+# Movie list response. ?format=columns returns one array per field instead of
+# one object per movie, which is smaller and cheaper to encode for large lists.
+def movies_response(records, stream=False):
+    if request.args.get('format') == 'columns':
+        return jsonify({column: [record[column] for record in records] for column in records[0]})
+    return records_response(records) if stream else jsonify(records)
+
+# Genre index built once at load: lowercased genre -> row positions, plus
+# per-genre counts (most common first) and the sorted genre names
+GENRE_INDEX = {}
+GENRE_COUNTS = []
+GENRES_SORTED = []
+if data is not None and 'genres' in data.columns:
+    genre_rows_lists = {}
+    genre_counts = {}
+    for row, genres_str in enumerate(data['genres']):
+        if isinstance(genres_str, str):
+            for genre in genres_str.split(','):
+                genre = genre.strip()
+                genre_counts[genre] = genre_counts.get(genre, 0) + 1
+                rows = genre_rows_lists.setdefault(genre.lower(), [])
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+    GENRE_INDEX = {g: np.asarray(rows, dtype=np.int32) for g, rows in genre_rows_lists.items()}
+    GENRE_COUNTS = sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)
+    GENRES_SORTED = sorted(genre_counts)
+
+# Movies per director (most common first), counted once for /stats
+DIRECTOR_COUNTS = []
+if data is not None and 'Director' in data.columns:
+    DIRECTOR_COUNTS = [(director, int(count)) for director, count in data['Director'].value_counts().items()]
+
+# Row positions (in dataset order) of movies whose genre contains genre_lower
+def genre_rows(genre_lower):
+    matches = [rows for genre, rows in GENRE_INDEX.items() if genre_lower in genre]
+    if not matches:
+        return np.array([], dtype=np.int32)
+    if len(matches) == 1:
+        return matches[0]
+    return np.unique(np.concatenate(matches))
+
+# Sorted copy of the titles so a prefix lookup becomes two binary searches
+TITLES_SORTED_IDX = np.argsort(TITLES, kind='stable')
+TITLES_SORTED = TITLES[TITLES_SORTED_IDX]
+
+# Row indices (in dataset order) of titles starting with prefix
+def prefix_rows(prefix):
+    lo = np.searchsorted(TITLES_SORTED, prefix, side='left')
+    hi = np.searchsorted(TITLES_SORTED, prefix + '\U0010ffff', side='left')
+    return np.sort(TITLES_SORTED_IDX[lo:hi])
+
+# Rows (ascending) whose title contains each 3-character sequence, so a
+# contains query only checks titles sharing all of its trigrams
+TITLE_TRIGRAMS = {}
+for row, title in enumerate(TITLES.tolist()):
+    for i in range(len(title) - 2):
+        rows = TITLE_TRIGRAMS.setdefault(title[i:i + 3], [])
+        if not rows or rows[-1] != row:
+            rows.append(row)
+TITLE_TRIGRAMS = {gram: np.asarray(rows, dtype=np.intp) for gram, rows in TITLE_TRIGRAMS.items()}
+
+# Needles shorter than a trigram scan the titles in chunks of this many rows
+TITLE_SCAN_CHUNK = 512
+
+# Row indices (in dataset order) of titles containing needle, at most limit
+# of them (limit <= 0 returns all)
+def contains_rows(needle, limit=0):
+    if len(needle) >= 3:
+        # Intersect the trigram row lists, smallest first, then confirm the
+        # whole needle on the few remaining candidates
+        candidates = sorted(
+            (TITLE_TRIGRAMS.get(needle[i:i + 3], np.array([], dtype=np.intp)) for i in range(len(needle) - 2)),
+            key=len,
+        )
+        rows = candidates[0]
+        for other in candidates[1:]:
+            if not rows.size:
+                break
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        if len(needle) > 3 and rows.size:
+            rows = rows[np.char.find(TITLES[rows], needle) >= 0]
+        return rows[:limit] if limit > 0 else rows
+    
+    # Short needles: scan in chunks, stopping once limit matches are found
+    found = []
+    count = 0
+    for start in range(0, len(TITLES), TITLE_SCAN_CHUNK):
+        hits = np.flatnonzero(np.char.find(TITLES[start:start + TITLE_SCAN_CHUNK], needle) >= 0) + start
+        found.append(hits)
+        count += hits.size
+        if 0 < limit <= count:
+            break
+    rows = np.concatenate(found) if found else np.array([], dtype=np.intp)
+    return rows[:limit] if limit > 0 else rows
+
+# Shuffled row order for random picks. Requests take consecutive slices of it
+# instead of sampling from scratch; it is reshuffled when a slice would wrap.
+# The generator is created per process on first use, so workers forked from a
+# preloaded master do not all hand out the same "random" picks.
+SHUFFLED_ROWS = np.arange(len(TITLES))
+SHUFFLE_LOCK = threading.Lock()
+shuffle_rng = None
+shuffle_pid = None
+shuffle_cursor = 0
+
+# count random row indices, never including the row exclude
+def random_rows(count, exclude=-1):
+    global shuffle_rng, shuffle_pid, shuffle_cursor
+    take = min(count + 1, len(SHUFFLED_ROWS))
+    with SHUFFLE_LOCK:
+        if shuffle_pid != os.getpid():
+            shuffle_rng = np.random.default_rng()
+            shuffle_pid = os.getpid()
+            shuffle_rng.shuffle(SHUFFLED_ROWS)
+            shuffle_cursor = 0
+        elif shuffle_cursor + take > len(SHUFFLED_ROWS):
+            shuffle_rng.shuffle(SHUFFLED_ROWS)
+            shuffle_cursor = 0
+        rows = SHUFFLED_ROWS[shuffle_cursor:shuffle_cursor + take].copy()
+        shuffle_cursor += take
+    return rows[rows != exclude][:count]
+
+# Load similarity matrix (float16, memory-mapped so only the rows actually
+# read are paged in; see convert_similarity_matrix.py)
 try:
-    cosine_sim = joblib.load('cosine_similarity_matrix.pkl')
+    cosine_sim = np.load('cosine_similarity_matrix.npy', mmap_mode='r')
     print("Cosine similarity matrix loaded successfully!")
 except FileNotFoundError:
-    print("Error: cosine_similarity_matrix.pkl not found.")
+    print("Error: cosine_similarity_matrix.npy not found.")
     cosine_sim = None
 
 # Get random popular movies
@@ -110,18 +345,7 @@ def get_popular_movies(limit=20):
             return None
         
         # Sample random movies from the dataset
-        popular_movies = data.sample(n=min(limit, len(data)))
-        result = popular_movies[['Title', 'Director', 'Cast', 'poster_path', 'genres', 'overview']].copy()
-        
-        # Format the data
-        result['Title'] = result['Title'].str.title()
-        result['poster_path'] = BASE_POSTER_URL + result['poster_path'].fillna('')
-        result['overview'] = result['overview'].fillna('No overview available')
-        result['Director'] = result['Director'].fillna('Unknown')
-        result['Cast'] = result['Cast'].fillna('Unknown')
-        result['genres'] = result['genres'].fillna('Unknown')
-        
-        return result
+        return movie_records(random_rows(limit))
     except Exception as e:
         print(f"Error getting popular movies: {e}")
         return None
@@ -135,35 +359,26 @@ def search_movies(query, limit=20):
         query_lower = query.strip().lower()
         
         # Priority 1: Movies that START with the query (prefix match)
-        starts_with = data[data['Title'].str.startswith(query_lower, na=False)]
-        
-        # Priority 2: Movies that CONTAIN the query (but don't start with it)
-        contains = data[
-            data['Title'].str.contains(query_lower, case=False, na=False) & 
-            ~data['Title'].str.startswith(query_lower, na=False)
-        ]
-        
-        # Combine: prefix matches first, then substring matches
-        matching_movies = pd.concat([starts_with, contains])
+        matching_rows = prefix_rows(query_lower)
+        
+        # Skip the substring scan when prefix matches already fill the limit
+        if not 0 < limit <= matching_rows.size:
+            # Priority 2: Movies that CONTAIN the query (but don't start with it).
+            # The first `limit` substring hits always include enough
+            # non-prefix rows to fill the remaining slots.
+            substring_rows = contains_rows(query_lower, limit)
+            
+            # Combine: prefix matches first, then substring matches
+            matching_rows = np.concatenate([matching_rows, substring_rows[~np.isin(substring_rows, matching_rows)]])
         
-        if matching_movies.empty:
+        if matching_rows.size == 0:
             return None
         
         # Limit results
-        if len(matching_movies) > limit:
-            matching_movies = matching_movies.head(limit)
-        
-        result = matching_movies[['Title', 'Director', 'Cast', 'poster_path', 'genres', 'overview']].copy()
+        if len(matching_rows) > limit:
+            matching_rows = matching_rows[:limit]
         
-        # Format the data
-        result['Title'] = result['Title'].str.title()
-        result['poster_path'] = BASE_POSTER_URL + result['poster_path'].fillna('')
-        result['overview'] = result['overview'].fillna('No overview available')
-        result['Director'] = result['Director'].fillna('Unknown')
-        result['Cast'] = result['Cast'].fillna('Unknown')
-        result['genres'] = result['genres'].fillna('Unknown')
-        
-        return result
+        return movie_records(matching_rows)
     except Exception as e:
         print(f"Error searching movies: {e}")
         return None
@@ -176,27 +391,14 @@ def get_movies_by_genre(genre, limit=20):
         
         genre_lower = genre.strip().lower()
         
-        # Filter movies by genre
-        genre_movies = data[data['genres'].str.contains(genre_lower, case=False, na=False)]
+        # Look up movies by genre in the precomputed index
+        genre_movies = genre_rows(genre_lower)
         
-        if genre_movies.empty:
+        if genre_movies.size == 0:
             return None
         
         # Limit results
-        if len(genre_movies) > limit:
-            genre_movies = genre_movies.head(limit)
-        
-        result = genre_movies[['Title', 'Director', 'Cast', 'poster_path', 'genres', 'overview']].copy()
-        
-        # Format the data
-        result['Title'] = result['Title'].str.title()
-        result['poster_path'] = BASE_POSTER_URL + result['poster_path'].fillna('')
-        result['overview'] = result['overview'].fillna('No overview available')
-        result['Director'] = result['Director'].fillna('Unknown')
-        result['Cast'] = result['Cast'].fillna('Unknown')
-        result['genres'] = result['genres'].fillna('Unknown')
-        
-        return result
+        return movie_records(genre_movies[:limit])
     except Exception as e:
         print(f"Error getting movies by genre: {e}")
         return None
@@ -207,18 +409,85 @@ def get_genres():
         if data is None:
             return []
         
-        all_genres = set()
-        for genres_str in data['genres'].dropna():
-            if isinstance(genres_str, str):
-                # Split genres and add to set
-                genres = [g.strip() for g in genres_str.split(',')]
-                all_genres.update(genres)
-        
-        return sorted(list(all_genres))
+        return GENRES_SORTED
     except Exception as e:
         print(f"Error getting genres: {e}")
         return []
 
+# Row of the movie best matching a normalized title, or None. Every strategy
+# is deterministic, so repeated titles are answered from the cache.
+@lru_cache(maxsize=4096)
+def match_title_row(search_title):
+    # Try multiple matching strategies
+    matched_title = None
+    
+    # Strategy 1: Exact match
+    if search_title in TITLE_TO_IDX:
+        matched_title = search_title
+        print(f"✓ Exact match found: '{matched_title}'")
+    
+    # Strategy 2: Prefix match (starts with)
+    if matched_title is None:
+        starts_with = prefix_rows(search_title)
+        if starts_with.size:
+            matched_title = TITLES[starts_with[0]]
+            print(f"✓ Prefix match found: '{search_title}' → '{matched_title}'")
+    
+    # Strategy 3: Contains match (anywhere in title)
+    if matched_title is None:
+        contains = contains_rows(search_title, 1)
+        if contains.size:
+            matched_title = TITLES[contains[0]]
+            print(f"✓ Contains match found: '{search_title}' → '{matched_title}'")
+    
+    # Strategy 4: Fuzzy match (remove special chars and try again)
+    if matched_title is None:
+        clean_search = PUNCTUATION_RE.sub('', search_title).strip()
+        # Either cleaned string containing the other counts as a match;
+        # keep the earliest row across both directions
+        fuzzy = np.flatnonzero(np.char.find(TITLES_CLEAN, clean_search) >= 0)[:1].tolist()
+        fuzzy += [
+            CLEAN_TITLE_ROWS[clean_search[i:j]]
+            for i in range(len(clean_search) + 1)
+            for j in range(i, min(len(clean_search), i + MAX_CLEAN_TITLE_LEN) + 1)
+            if clean_search[i:j] in CLEAN_TITLE_ROWS
+        ]
+        if fuzzy:
+            matched_title = TITLES[min(fuzzy)]
+            print(f"✓ Fuzzy match found: '{search_title}' → '{matched_title}'")
+    
+    if matched_title is None:
+        return None
+    return TITLE_TO_IDX[matched_title]
+
+# Rows recommended for the movie at idx: its nearest neighbours in the
+# similarity matrix, or movies sharing its first genre when idx is past the
+# end of the matrix. Empty when neither applies (callers then pick randomly).
+@lru_cache(maxsize=4096)
+def similar_rows(idx):
+    # Check if index is within cosine similarity matrix bounds
+    matrix_size = cosine_sim.shape[0]
+    if idx >= matrix_size:
+        print(f"⚠️ Warning: Movie index {idx} is out of bounds (matrix size: {matrix_size})")
+        print(f"Movie '{TITLES[idx]}' is too new or not in the similarity matrix.")
+        
+        # Fallback: Return movies from same genre
+        movie_genres = data.iloc[idx]['genres']
+        if pd.notna(movie_genres) and movie_genres != 'Unknown':
+            print(f"Fallback: Finding movies with similar genres: {movie_genres}")
+            similar_genre_movies = genre_rows(movie_genres.split(',')[0].strip().lower())
+            return tuple(similar_genre_movies[similar_genre_movies != idx][:10].tolist())
+        return ()
+    
+    # Normal recommendation flow
+    # Partial selection of the 11 best scores (the movie itself plus
+    # 10 recommendations), then sort only those
+    row = cosine_sim[idx]
+    k = min(11, len(row))
+    top = np.argpartition(row, -k)[-k:]
+    top = top[np.lexsort((top, -row[top]))]
+    return tuple(top[top != idx][:10].tolist())  # Get top 10 recommendations
+
 # Recommendation logic (with improved matching)
 def recommendations(title):
     try:
@@ -226,93 +495,21 @@ def recommendations(title):
             print("Error: Dataset or cosine similarity matrix not loaded.")
             return None
 
-        # Clean and format the input title
-        search_title = title.strip().lower()
-        
-        # Try multiple matching strategies
-        matched_title = None
-        
-        # Strategy 1: Exact match
-        exact_match = data[data['Title'] == search_title]
-        if not exact_match.empty:
-            matched_title = search_title
-            print(f"✓ Exact match found: '{matched_title}'")
-        
-        # Strategy 2: Prefix match (starts with)
-        if matched_title is None:
-            starts_with = data[data['Title'].str.startswith(search_title, na=False)]
-            if not starts_with.empty:
-                matched_title = starts_with.iloc[0]['Title']
-                print(f"✓ Prefix match found: '{title}' → '{matched_title}'")
-        
-        # Strategy 3: Contains match (anywhere in title)
-        if matched_title is None:
-            contains = data[data['Title'].str.contains(search_title, case=False, na=False, regex=False)]
-            if not contains.empty:
-                matched_title = contains.iloc[0]['Title']
-                print(f"✓ Contains match found: '{title}' → '{matched_title}'")
-        
-        # Strategy 4: Fuzzy match (remove special chars and try again)
-        if matched_title is None:
-            import re
-            clean_search = re.sub(r'[^\w\s]', '', search_title).strip()
-            for movie_title in data['Title']:
-                clean_movie = re.sub(r'[^\w\s]', '', str(movie_title)).strip()
-                if clean_search in clean_movie or clean_movie in clean_search:
-                    matched_title = movie_title
-                    print(f"✓ Fuzzy match found: '{title}' → '{matched_title}'")
-                    break
+        # Clean and format the input title, then find the matching movie
+        idx = match_title_row(title.strip().lower())
         
         # If no match found
-        if matched_title is None:
+        if idx is None:
             print(f"✗ Movie title '{title}' not found in dataset after all strategies")
             return None
-
-        # Get the index of the matched movie
-        idx = data[data['Title'] == matched_title].index[0]
         
-        # Check if index is within cosine similarity matrix bounds
-        matrix_size = cosine_sim.shape[0]
-        if idx >= matrix_size:
-            print(f"⚠️ Warning: Movie index {idx} is out of bounds (matrix size: {matrix_size})")
-            print(f"Movie '{matched_title}' is too new or not in the similarity matrix.")
-            
-            # Fallback: Return movies from same genre
-            movie_genres = data.iloc[idx]['genres']
-            if pd.notna(movie_genres) and movie_genres != 'Unknown':
-                print(f"Fallback: Finding movies with similar genres: {movie_genres}")
-                similar_genre_movies = data[
-                    (data['genres'].str.contains(movie_genres.split(',')[0].strip(), case=False, na=False)) &
-                    (data.index != idx)
-                ].head(10)
-                
-                if not similar_genre_movies.empty:
-                    recommended_movies = similar_genre_movies[['Title', 'Director', 'Cast', 'poster_path', 'genres', 'overview']].copy()
-                else:
-                    # Last resort: return random popular movies
-                    print("Fallback: Returning random popular movies")
-                    recommended_movies = data[data.index != idx].sample(n=min(10, len(data)-1))[['Title', 'Director', 'Cast', 'poster_path', 'genres', 'overview']].copy()
-            else:
-                # Return random movies as last resort
-                recommended_movies = data[data.index != idx].sample(n=min(10, len(data)-1))[['Title', 'Director', 'Cast', 'poster_path', 'genres', 'overview']].copy()
-        else:
-            # Normal recommendation flow
-            sim_scores = list(enumerate(cosine_sim[idx]))
-            sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-            sim_scores = sim_scores[1:11]  # Get top 10 recommendations
-            movie_indices = [i[0] for i in sim_scores]
-            
-            recommended_movies = data[['Title', 'Director', 'Cast', 'poster_path', 'genres', 'overview']].iloc[movie_indices].copy()
+        movie_indices = similar_rows(idx)
+        if not movie_indices:
+            # Last resort: return random popular movies
+            print("Fallback: Returning random popular movies")
+            return movie_records(random_rows(10, exclude=idx))
         
-        # Format the data for better display
-        recommended_movies['Title'] = recommended_movies['Title'].str.title()  # Capitalize movie titles
-        recommended_movies['poster_path'] = BASE_POSTER_URL + recommended_movies['poster_path'].fillna('')
-        recommended_movies['overview'] = recommended_movies['overview'].fillna('No overview available')
-        recommended_movies['Director'] = recommended_movies['Director'].fillna('Unknown')
-        recommended_movies['Cast'] = recommended_movies['Cast'].fillna('Unknown')
-        recommended_movies['genres'] = recommended_movies['genres'].fillna('Unknown')
-        
-        return recommended_movies
+        return movie_records(movie_indices)
     except Exception as e:
         print(f"Error during recommendation generation: {e}")
         return None
@@ -345,735 +542,50 @@ def contact():
 def disclaimer():
     return render_template('disclaimer.html')
 
-# Blog content database with high-quality SEO-optimized content
-BLOG_POSTS = {
-    'best-netflix-movies-2025': {
-        'title': 'Best Movies to Watch on Netflix 2025 - Top Picks & Hidden Gems',
-        'meta_description': 'Discover the best movies on Netflix in 2025. From Oscar winners to hidden gems, find your next binge-worthy film with our expertly curated list of must-watch titles.',
-        'date': '2025-01-15',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Why Netflix Remains the King of Streaming in 2025',
-                'text': 'Netflix continues to dominate the streaming landscape with its massive library of over 15,000 titles and award-winning original content. In 2025, the platform has invested heavily in exclusive films, bringing theatrical-quality productions directly to your home. From critically acclaimed dramas like "The Power of the Dog" to blockbuster action films such as "Red Notice," Netflix offers an unparalleled variety of content. The platform\'s commitment to international cinema has also expanded, showcasing films from Korea, India, Spain, and beyond. With advanced recommendation algorithms and personalized content discovery, Netflix ensures every viewer finds something they love. The streaming giant has doubled down on quality over quantity, curating exceptional films that resonate with global audiences while maintaining affordable subscription plans.'
-            },
-            {
-                'heading': 'Top 10 Must-Watch Netflix Original Movies',
-                'text': 'Our expert team has analyzed viewer ratings, critical reviews, and cultural impact to bring you the definitive list of Netflix must-watches. These films span multiple genres including thriller, romance, sci-fi, and documentary. Each movie has been selected for exceptional storytelling, outstanding performances, and production quality that rivals theatrical releases. Must-see titles include "The Irishman" directed by Martin Scorsese, featuring career-best performances from Robert De Niro and Al Pacino. "Marriage Story" offers a heartbreaking yet beautiful exploration of divorce and family. "Roma" showcases Alfonso Cuarón\'s masterful cinematography in this deeply personal Mexican drama. Action fans will love "Extraction" with Chris Hemsworth\'s intense performance. For sci-fi enthusiasts, "The Midnight Sky" and "Don\'t Look Up" deliver thought-provoking entertainment with A-list casts.'
-            },
-            {
-                'heading': 'Hidden Gems and Underrated Netflix Movies',
-                'text': 'Beyond the trending titles, Netflix harbors incredible hidden gems that deserve your attention. These underrated masterpieces often fly under the radar but offer some of the most compelling storytelling on the platform. "I Care a Lot" presents a darkly comedic thriller about a legal guardian scam. "The Platform" delivers a disturbing Spanish sci-fi allegory about class systems. "His House" reinvents the horror genre with a refugee story that\'s both terrifying and deeply moving. International gems include "Cargo" from Australia, "Calibre" from Scotland, and "Time to Hunt" from South Korea. Documentary lovers shouldn\'t miss "The Social Dilemma," which exposes social media\'s impact on society. These films expand your cinematic horizons and provide fresh perspectives from talented filmmakers worldwide who bring unique cultural viewpoints to universal themes.'
-            },
-            {
-                'heading': 'How to Find Your Perfect Netflix Movie in 2025',
-                'text': 'With thousands of options, finding the right movie can be overwhelming. Netflix\'s advanced search filters allow you to browse by genre, release year, IMDb rating, and runtime. Use the "surprise me" feature for random recommendations based on your viewing history. Pay attention to the percentage match score – it\'s surprisingly accurate when the system has enough data about your preferences. Create multiple profiles for different moods: one for serious dramas, another for light comedies. Follow Netflix\'s curated collections like "Critically Acclaimed Films" or "Award-Winning Movies." Check the "Top 10 in Your Country" section for trending content. Use FreeMovieSearcher\'s recommendation engine for personalized AI-powered suggestions that go beyond Netflix\'s algorithm. Read user reviews and watch trailers before committing. Set up a watchlist and rate everything you watch to improve future recommendations.'
-            }
-        ]
-    },
-    'top-10-movies-all-time': {
-        'title': 'Top 10 Movies of All Time - Greatest Films Ever Made',
-        'meta_description': 'Explore the top 10 greatest movies of all time. From The Godfather to Shawshank Redemption, discover cinematic masterpieces that defined generations and changed filmmaking forever.',
-        'date': '2025-01-10',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'What Makes a Movie Truly Timeless',
-                'text': 'A truly great film transcends its era, speaking to universal human experiences that resonate across generations. These cinematic masterpieces combine exceptional storytelling, groundbreaking direction, powerful performances, and technical excellence that remains impressive decades later. Timeless movies challenge our perspectives, evoke deep emotions, and leave lasting impressions that endure long after the credits roll. They tackle fundamental questions about human nature, morality, love, loss, and redemption. Technical innovations in these films often revolutionized cinematography, editing, sound design, and narrative structure. The greatest movies aren\'t just entertaining – they reflect and shape culture, influence countless filmmakers, and become part of our collective consciousness. They achieve perfect harmony between artistic vision and emotional resonance, creating experiences that feel both intimate and epic. These films remain relevant because they explore timeless themes through unforgettable characters and masterful craftsmanship.'
-            },
-            {
-                'heading': 'The Godfather - The Ultimate Cinematic Masterpiece',
-                'text': 'Francis Ford Coppola\'s 1972 epic remains the gold standard of cinema and consistently ranks as the greatest film ever made. This saga of the Corleone crime family revolutionized the gangster genre with its operatic scope, nuanced characters, and profound exploration of power, family, and the American Dream. Marlon Brando\'s iconic performance as Don Vito Corleone earned him an Oscar and created one of cinema\'s most memorable characters. Al Pacino\'s transformation from reluctant war hero Michael to cold-blooded mafia boss represents one of the greatest character arcs in film history. Gordon Willis\'s shadowy cinematography creates an immersive world that feels both intimate and epic. Nino Rota\'s haunting score has become synonymous with cinematic excellence. The film\'s meticulous attention to detail, from period-accurate costumes to authentic Italian-American cultural elements, creates unparalleled authenticity. Its themes of loyalty, betrayal, corruption, and family dynamics remain universally relevant fifty years after release.'
-            },
-            {
-                'heading': 'The Shawshank Redemption - Hope, Friendship, and Freedom',
-                'text': 'Frank Darabont\'s adaptation of Stephen King\'s novella has become the most beloved film in cinematic history, topping IMDb\'s rankings for years. This powerful story of friendship, hope, and redemption follows Andy Dufresne through 20 years of wrongful imprisonment at Shawshank State Penitentiary. Tim Robbins delivers a nuanced performance as the falsely convicted banker who maintains his humanity despite brutal circumstances. Morgan Freeman\'s narration as Red provides warmth, wisdom, and the perfect counterbalance to Andy\'s quiet determination. The film\'s emotional depth comes from its exploration of institutionalization, the persistence of hope in hopeless situations, and the transformative power of friendship. Roger Deakins\'s cinematography captures both the oppressive prison environment and moments of transcendent beauty. Thomas Newman\'s score enhances every emotional beat without overwhelming the narrative. The film\'s final act delivers one of cinema\'s most satisfying payoffs, proving that patience, intelligence, and hope can overcome any obstacle.'
-            },
-            {
-                'heading': 'Why These Films Define Cinema History',
-                'text': 'Each film on this list has fundamentally shaped the art of filmmaking and influenced countless directors, writers, and cinematographers. They introduced innovative techniques that became industry standards and pushed narrative boundaries that redefined what cinema could achieve. "Citizen Kane" pioneered deep focus photography and non-linear storytelling. "Casablanca" perfected the romantic drama and created immortal dialogue. "Pulp Fiction" proved non-linear narratives could be commercially successful and artistically brilliant. "Schindler\'s List" demonstrated cinema\'s power to document history and honor victims of genocide. "The Dark Knight" elevated superhero films to serious dramatic art. "12 Angry Men" proved that compelling cinema doesn\'t require elaborate sets or action. These movies didn\'t just entertain – they transformed the medium itself, expanded what audiences expected from films, and proved that popular entertainment could also be profound art. Their influence continues today in every film school, streaming platform, and movie theater worldwide.'
-            }
-        ]
-    },
-    'best-action-movies': {
-        'title': 'Best Action Movies of All Time - Ultimate Adrenaline-Pumping Films',
-        'meta_description': 'Experience the best action movies ever made. From Die Hard to Mad Max Fury Road, discover explosive films delivering non-stop thrills, incredible stunts, and unforgettable heroes.',
-        'date': '2025-01-08',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Evolution of Action Cinema Through the Decades',
-                'text': 'Action movies have evolved dramatically from simple chase sequences to complex spectacles combining cutting-edge technology, intricate choreography, and compelling narratives. The 1980s gave us muscular heroes like Arnold Schwarzenegger and Sylvester Stallone in straightforward good-versus-evil stories. The 1990s introduced wire-fu techniques from Hong Kong cinema, revolutionizing fight choreography in Hollywood. The 2000s brought CGI-enhanced set pieces and the Bourne franchise\'s gritty realism. Modern action films balance heart-pounding set pieces with character development and emotional stakes that make audiences care about outcomes. The genre has expanded globally, incorporating martial arts from Asia, parkour from Europe, and innovative stunt work from around the world. Today\'s best action films blend practical effects with digital wizardry, creating impossible yet believable sequences. Directors like Christopher Nolan, George Miller, and the Russo Brothers have elevated action filmmaking to an art form, proving that spectacle and substance can coexist beautifully.'
-            },
-            {
-                'heading': 'Die Hard - The Perfect Action Movie Blueprint',
-                'text': 'John McTiernan\'s 1988 masterpiece redefined the action genre by placing an ordinary hero in extraordinary circumstances at Nakatomi Plaza. Bruce Willis\'s John McClane became the everyman action hero – vulnerable, witty, resourceful, and distinctly human. Unlike invincible 1980s action heroes, McClane bleeds, hurts, and doubts himself, making his victories more satisfying. The film\'s tight setting creates escalating tension as McClane faces insurmountable odds with limited resources. Alan Rickman\'s Hans Gruber remains one of cinema\'s greatest villains – sophisticated, intelligent, and genuinely threatening. The perfectly timed humor releases tension without undercutting stakes. Jan de Bont\'s cinematography captures both intimate character moments and spectacular action sequences. The script balances explosive set pieces with character development and emotional depth. Die Hard created a template that countless movies have tried to replicate but few have matched: "Die Hard on a bus" (Speed), "Die Hard on a plane" (Air Force One), "Die Hard in the White House" (Olympus Has Fallen).'
-            },
-            {
-                'heading': 'Mad Max Fury Road - Visual Poetry in Constant Motion',
-                'text': 'George Miller\'s 2015 return to the wasteland delivered the most visually stunning and relentlessly paced action film of the 21st century. This two-hour chase sequence combines practical stunts, imaginative world-building, and surprisingly deep themes about survival, redemption, and patriarchal oppression. Charlize Theron\'s Imperator Furiosa is one of action cinema\'s greatest characters – a fierce warrior with emotional depth and clear motivations. Tom Hardy\'s Max serves as the titular character while allowing Furiosa\'s story to drive the narrative. The film\'s decision to use practical effects over CGI created authentic, jaw-dropping stunts that feel viscerally real. Every frame is meticulously composed, using vibrant colors in a post-apocalyptic setting typically rendered in grays and browns. The guitar-playing, flame-throwing Doof Warrior became an instant icon. John Seale\'s Oscar-winning cinematography and Margaret Sixel\'s editing create visual poetry in motion. The film proves action cinema can be both spectacular and meaningful, delivering feminist themes without sacrificing entertainment value.'
-            },
-            {
-                'heading': 'What Makes Action Movies Truly Great and Memorable',
-                'text': 'The best action films balance spectacle with substance, creating experiences that satisfy both viscerally and emotionally. They feature memorable heroes with clear motivations, compelling villains who pose genuine threats, and creative set pieces that constantly raise the stakes. Great action requires clear spatial geography so audiences understand where characters are and what\'s happening – the Bourne franchise\'s shaky-cam style, while influential, makes inferior action when audiences can\'t follow the movement. Practical stunts create authentic thrills that CGI can\'t match, though digital effects enhance rather than replace real stunt work. Emotional investment makes us care about outcomes – we must believe characters are truly in danger. Whether through Jackie Chan\'s inventive practical stunts, John Wick\'s gun-fu choreography, or Mission Impossible\'s death-defying Tom Cruise sequences, great action movies keep audiences on the edge of their seats while delivering satisfaction, catharsis, and unforgettable cinematic moments that become part of popular culture.'
-            }
-        ]
-    },
-    'best-horror-movies': {
-        'title': 'Best Horror Movies - Scariest Films That Will Haunt You Forever',
-        'meta_description': 'Brave the best horror movies ever made. From The Exorcist to Hereditary, discover terrifying psychological thrillers and supernatural scares keeping you up at night.',
-        'date': '2025-01-05',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Psychology of Fear in Horror Cinema',
-                'text': 'Horror movies tap into our primal fears and anxieties, creating controlled environments where we can safely experience terror and confront our deepest nightmares. The genre explores darkness within humanity, supernatural forces beyond our comprehension, and the terrifying unknown lurking in shadows. Great horror films use atmosphere, sound design, and pacing to build dread gradually, making what we don\'t see often more terrifying than what we do. They reflect societal fears and personal anxieties through metaphor and symbolism – zombies represent consumerism and conformity, vampires embody sexuality and disease, ghosts manifest guilt and unresolved trauma. The best horror respects audiences\' intelligence, allowing them to fill gaps with their own fears. Jump scares provide momentary shocks, but sustained dread creates lasting terror. Horror serves psychological functions beyond entertainment: it allows cathartic release of anxiety, helps process real-world traumas through fictional scenarios, and reminds us we\'re alive through adrenaline rushes and heightened awareness.'
-            },
-            {
-                'heading': 'The Exorcist - Terror That Transcends Generations',
-                'text': 'William Friedkin\'s 1973 masterpiece remains the gold standard of horror cinema and the most profitable horror film ever made. The possession of young Regan MacNeil combines visceral shock with profound questions about faith, innocence, evil, and the existence of God. Its realistic approach, avoiding typical horror movie aesthetics, makes the supernatural elements more disturbing. Linda Blair\'s haunting performance, enhanced by Mercedes McCambridge\'s demon voice and Dick Smith\'s groundbreaking makeup effects, created genuine terror that disturbs audiences today. Max von Sydow\'s Father Merrin embodies weathered faith facing ultimate evil. The film\'s slow build allows deep character development before unleashing full horror. Owen Roizman\'s naturalistic cinematography grounds supernatural events in gritty realism. Mike Oldfield\'s "Tubular Bells" theme has become synonymous with demonic terror. The spider-walk scene, restored in later editions, remains nightmare fuel. William Peter Blatty\'s script explores theological questions while delivering terrifying set pieces. The Exorcist elevated horror to serious artistic and commercial heights, proving the genre could be both frightening and intellectually substantial.'
-            },
-            {
-                'heading': 'Modern Horror - Elevated Fear and Social Commentary',
-                'text': 'Contemporary horror has embraced psychological depth and social commentary, creating what critics call "elevated horror" or "post-horror." Jordan Peele\'s "Get Out" uses body-snatching horror to examine racism and liberal hypocrisy, becoming a cultural phenomenon and Oscar winner. Ari Aster\'s "Hereditary" explores inherited trauma and family dysfunction through demonic possession, delivering gut-wrenching scares and emotional devastation. "The Witch" employs period-accurate dialogue and slow-burn tension to explore religious extremism and female agency in Puritan New England. "A Quiet Place" creates innovative premise-driven horror requiring absolute silence. "It Follows" uses STD metaphors for inescapable death. This elevated approach treats horror with artistic ambition, using terror as a lens to examine trauma, grief, racism, and family dysfunction. These films prove horror can be both frightening and intellectually stimulating, earning critical acclaim while delivering genuine scares. They respect audiences\' intelligence, favoring psychological horror over cheap jump scares, creating lasting dread through atmosphere, performance, and subtext.'
-            },
-            {
-                'heading': 'Why We Love Being Scared by Horror Movies',
-                'text': 'Horror movies provide safe spaces to confront our fears and experience intense emotions without real danger. They trigger adrenaline rushes and endorphin releases, creating natural highs similar to extreme sports or roller coasters. Watching horror with others builds social bonds through shared experience and collective reaction – screaming together creates intimacy and memorable moments. The genre offers catharsis, allowing us to process real-world anxieties through fictional scenarios, providing emotional release for pent-up stress and fear. Horror validates feelings of anxiety and dread, showing we\'re not alone in our fears. Surviving scary movies provides sense of accomplishment and mastery over fear. The genre\'s transgressive nature appeals to our darker curiosities, exploring taboo subjects and forbidden knowledge in safe contexts. Horror fans develop sophisticated understanding of genre conventions, deriving pleasure from analyzing techniques and recognizing references. Ultimately, horror reminds us we\'re alive and capable of surviving fear, making ordinary life seem safer by comparison and helping us appreciate moments of peace and normalcy.'
-            }
-        ]
-    },
-    'best-romantic-movies': {
-        'title': 'Best Romantic Movies - Love Stories That Touch the Heart',
-        'meta_description': 'Fall in love with the best romantic movies. From timeless classics to modern love stories, discover films that celebrate romance in all its forms.',
-        'image': 'https://picsum.photos/1200/630?random=40',
-        'date': '2025-01-03',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Power of Love Stories in Cinema',
-                'text': 'Romantic movies capture the most profound human emotion—love. These films explore connection, vulnerability, heartbreak, and joy through unforgettable characters and stories. From sweeping epics to intimate character studies, romantic cinema reminds us why we believe in love despite its challenges. Great romance films balance chemistry, authenticity, and emotional depth to create experiences that resonate long after viewing.',
-                'image': 'https://picsum.photos/800/450?random=41'
-            },
-            {
-                'heading': 'Classic Romance: Timeless Love Stories',
-                'text': 'Classic romantic films like Casablanca, Gone with the Wind, and Roman Holiday set the standard for the genre. These movies combine passionate performances, memorable dialogue, and sweeping cinematography. They explore love against the backdrop of war, social barriers, and personal sacrifice, showing that true romance transcends time and circumstance. These films remain relevant because they capture universal truths about love and human connection.',
-                'image': 'https://picsum.photos/800/450?random=42'
-            },
-            {
-                'heading': 'Modern Romance: Love in Contemporary Times',
-                'text': 'Contemporary romantic films like La La Land, The Notebook, and Eternal Sunshine of the Spotless Mind bring fresh perspectives to love stories. These movies tackle modern relationships, realistic challenges, and complex emotions. They show that romance isn\'t always fairy-tale perfect—it involves compromise, growth, and sometimes heartbreak. Modern romance celebrates authenticity over fantasy while still capturing the magic of falling in love.',
-                'image': 'https://picsum.photos/800/450?random=43'
-            },
-            {
-                'heading': 'Why Romance Movies Endure',
-                'text': 'Romantic films endure because they speak to our deepest desires for connection and understanding. They provide escapism while also reflecting real emotions and experiences. Whether comedic or dramatic, these movies validate our feelings and remind us that love, despite its complications, is worth pursuing. Romance cinema continues to evolve, embracing diverse stories and modern sensibilities while honoring the genre\'s emotional core.',
-                'image': 'https://picsum.photos/800/450?random=44'
-            }
-        ]
-    },
-    'best-comedy-movies': {
-        'title': 'Best Comedy Movies - Hilarious Films That Make You Laugh Until It Hurts',
-        'meta_description': 'Laugh out loud with the best comedy movies of all time. From slapstick to satire, witty dialogue to physical comedy, discover films delivering perfect comedic timing and unforgettable humor.',
-        'date': '2025-01-02',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Art of Making People Laugh Through Cinema',
-                'text': 'Comedy is one of cinema\'s most challenging and rewarding genres, requiring perfect timing, relatable characters, sharp writing, and fearless performances. The best comedies make us laugh while often sneaking in social commentary, emotional depth, or thought-provoking themes beneath the humor. From physical comedy pioneered by silent film stars to witty dialogue that rivals dramatic scripts, great comedy films create moments of pure joy and laughter that bring audiences together in shared amusement. Comedy serves essential functions beyond entertainment – it challenges authority, questions social norms, provides relief from stress, and helps us process difficult topics through humor. The genre encompasses vast territory: slapstick, romantic comedy, satire, parody, dark comedy, mockumentary, and absurdist humor. Great comedic performances require as much skill as dramatic ones, demanding timing, commitment, and vulnerability. Whether through elaborate physical gags, perfectly timed one-liners, or awkward social situations, comedy connects us through universal human experiences rendered hilarious.'
-            },
-            {
-                'heading': 'Classic Comedy - Timeless Humor That Never Gets Old',
-                'text': 'Classic comedies like "Some Like It Hot," "Airplane!," "Monty Python and the Holy Grail," and "The Princess Bride" have stood the test of time with their clever scripts, memorable performances, and innovative comedic techniques. These films prove that great comedy doesn\'t age – the humor remains fresh decades later, making new generations laugh just as hard. They combine visual gags, wordplay, absurdist situations, and perfectly timed delivery to create comedy gold that transcends its era. "Some Like It Hot" features Tony Curtis and Jack Lemmon in drag escaping gangsters, creating gender-bending comedy that still kills. "Airplane!" revolutionized spoof comedy with its rapid-fire jokes and straight-faced delivery of absurdity. Charlie Chaplin and Buster Keaton\'s silent films prove physical comedy needs no words. These movies taught Hollywood how to balance absurdity with heart, silliness with intelligence, and laughs with genuine emotion. They established comedic tropes and timing that modern films still reference.'
-            },
-            {
-                'heading': 'Modern Comedy - Contemporary Laughs and Fresh Perspectives',
-                'text': 'Contemporary comedies like "Superbad," "The Grand Budapest Hotel," "Bridesmaids," "Get Out" (horror-comedy), and "Knives Out" bring modern sensibilities to the genre while honoring its traditions. These films tackle current issues with humor, featuring diverse voices, fresh perspectives, and willingness to push boundaries. Modern comedy embraces improvisation, cringe humor, meta-commentary, genre-blending, and self-awareness while maintaining the genre\'s core mission – making people laugh until their sides hurt. Judd Apatow\'s films balance raunch with heart. Wes Anderson creates whimsical visual comedy. Jordan Peele proves horror and comedy can coexist brilliantly. The rise of mockumentaries from "This Is Spinal Tap" to "What We Do in the Shadows" creates new comedic possibilities. Modern comedies address social issues like sexism, racism, and class through satirical lenses. They prove comedy continues to evolve, remain culturally relevant, and adapt to changing audiences while maintaining the timeless goal of bringing joy through laughter.'
-            },
-            {
-                'heading': 'Why We Need Comedy Now More Than Ever',
-                'text': 'Comedy films provide essential relief from daily stress, anxiety, serious cinema, and difficult world events. Laughter releases endorphins, reduces cortisol levels, strengthens social bonds, and creates positive emotional states that improve mental health. Comedy movies bring people together, create shared cultural moments through quotable lines, and help us process difficult topics like death, politics, and social issues through humor that makes them manageable. In challenging times filled with division and stress, comedy reminds us to find joy, not take life too seriously, and laugh at our shared human absurdities. The best comedies leave us feeling lighter, happier, and more connected to others. They provide perspective on problems, defuse tension through laughter, and remind us that humor is fundamental to human resilience. Whether through silly pranks, clever wordplay, satirical commentary, or awkward cringe moments, comedy celebrates the ridiculous aspects of existence and helps us survive through laughter. In a world that often feels overwhelming, comedy movies are therapeutic experiences that remind us joy is always possible.'
-            }
-        ]
-    },
-    'best-sci-fi-movies': {
-        'title': 'Best Science Fiction Movies - Mind-Bending Sci-Fi Masterpieces That Challenge Reality',
-        'meta_description': 'Explore the best sci-fi movies of all time. From 2001 Space Odyssey to Blade Runner and Inception, discover films that push the boundaries of imagination, technology, and human existence.',
-        'date': '2025-01-01',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Science Fiction - Exploring Infinite Possibilities Beyond Our World',
-                'text': 'Science fiction cinema pushes the boundaries of imagination, exploring what could be rather than what is, creating visions of possible futures and alternate realities. These films tackle big questions about humanity, technology, consciousness, artificial intelligence, space exploration, and existence itself. Sci-fi combines spectacular visuals and groundbreaking special effects with philosophical depth and social commentary, creating worlds that challenge our perceptions and expand our understanding of reality. The best sci-fi movies are both entertaining spectacles that thrill audiences and thought-provoking meditations on the human condition that linger in minds long after viewing. They serve as mirrors reflecting present concerns about technology, environment, and society through futuristic settings. From dystopian warnings about technological overreach to optimistic visions of human potential, science fiction explores every possibility. The genre allows filmmakers to examine contemporary issues like surveillance, climate change, artificial intelligence, genetic engineering, and social inequality through metaphorical distance that makes difficult conversations possible.'
-            },
-            {
-                'heading': '2001: A Space Odyssey - The Ultimate Cinematic Trip Into Unknown',
-                'text': 'Stanley Kubrick\'s 1968 masterpiece revolutionized science fiction cinema with its realistic depiction of space travel, profound exploration of human evolution, and ambiguous philosophical themes. The film\'s stunning practical effects, minimal dialogue, meditative pacing, and ambiguous ending created an immersive experience that demands active viewer engagement and interpretation. From the iconic HAL 9000 artificial intelligence to the psychedelic star gate sequence representing transcendence, from bone-as-weapon to orbiting space station in one cut spanning millions of years, 2001 remains the most influential and visually groundbreaking sci-fi film ever made. The opening "Dawn of Man" sequence explores humanity\'s origins and tool use. HAL\'s malfunction examines artificial intelligence dangers. The final sequence beyond Jupiter presents transformation and evolution beyond human comprehension. Kubrick\'s meticulous attention to scientific accuracy, working with NASA and aerospace companies, created believable spaceflight decades before actual technology caught up. The film\'s partnership with Arthur C. Clarke produced both philosophical depth and hard science fiction credibility.'
-            },
-            {
-                'heading': 'Blade Runner - Questioning What Truly Makes Us Human',
-                'text': 'Ridley Scott\'s 1982 neo-noir masterpiece explores identity, memory, mortality, and humanity through its story of bioengineered replicants seeking their creator and extended lifespan. The film\'s stunning cyberpunk aesthetic – rain-soaked streets, neon signs, towering corporate pyramids, multicultural fusion – influenced countless works and defined the visual language of future noir. Vangelis\'s haunting synthesizer score creates melancholic atmosphere perfectly matching the film\'s themes. Roy Batty\'s "Tears in Rain" monologue before death represents one of cinema\'s most poignant meditations on mortality and meaning. Blade Runner asks whether artificial beings with emotions, memories (even if implanted), and fear of death are truly different from humans, a question increasingly relevant in our age of advancing AI, genetic engineering, and transhumanism. The film\'s deliberately ambiguous ending (particularly in the director\'s cut) about Deckard\'s own nature forces viewers to confront their assumptions. Its exploration of corporate power, environmental collapse, class division, and exploitation remains eerily prescient.'
-            },
-            {
-                'heading': 'Why Science Fiction Matters and Shapes Our Future',
-                'text': 'Science fiction films serve as laboratories for exploring future possibilities, testing ideas, and examining present concerns through speculative distance. They examine technology\'s impact on society, relationships, identity, and humanity itself. Sci-fi envisions alternative realities, challenges our assumptions about progress and civilization, and forces us to confront possibilities both wonderful and terrifying. The genre provides safe spaces to discuss controversial topics – genetic engineering, surveillance states, environmental catastrophe, alien contact, technological singularity – through metaphor and allegory that allows exploration without immediate political baggage. These films inspire real-world innovation, influencing scientists, engineers, and inventors while simultaneously warning about potential dangers and unintended consequences. Many technologies depicted in classic sci-fi – tablets, video calls, AI assistants, virtual reality – have become reality. Science fiction is both entertaining and culturally significant, shaping how we imagine the future and guiding discussions about the world we\'re creating. It reminds us that the future isn\'t fixed but shaped by choices we make today.'
-            }
-        ]
-    },
-    'how-to-find-good-movies': {
-        'title': 'How to Find Good Movies to Watch - Expert Tips, Tricks & Proven Strategies',
-        'meta_description': 'Discover proven methods to find great movies tailored to your taste. Learn expert strategies for discovering hidden gems, using recommendation engines, and never running out of amazing films to watch.',
-        'date': '2024-12-28',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Modern Challenge of Too Many Choices and Decision Paralysis',
-                'text': 'With thousands of movies available across multiple streaming platforms – Netflix, Amazon Prime, Disney+, Hulu, Apple TV+, HBO Max – finding the perfect film can be overwhelming and time-consuming. The abundance of choice often leads to decision paralysis, where we spend more time endlessly browsing through thumbnails than actually watching movies. This phenomenon, known as "choice overload," causes stress and dissatisfaction even when options are good. This comprehensive guide provides proven strategies to cut through the noise, overcome browsing fatigue, and discover films you\'ll genuinely love. From using sophisticated recommendation algorithms to exploring curated lists from trusted sources, from understanding your own viewing patterns to discovering international cinema, we\'ll help you become a more efficient and satisfied movie hunter. The key is developing systematic approaches that work with your preferences rather than against the overwhelming options. Stop scrolling endlessly and start watching films that truly resonate with you.'
-            },
-            {
-                'heading': 'Use Recommendation Engines and Algorithms Wisely for Better Matches',
-                'text': 'Modern recommendation systems use sophisticated algorithms analyzing your viewing history, ratings, watch time, pausing patterns, and preferences to suggest personalized picks with surprising accuracy. Services like Netflix, IMDb, Letterboxd, and FreeMovieSearcher employ machine learning and collaborative filtering to match you with films based on complex preference patterns. The key is actively rating movies you watch – the more data you provide through thumbs up/down, star ratings, or written reviews, the better recommendations become exponentially. Don\'t ignore percentage match scores displayed on streaming services; they\'re surprisingly accurate when the system has accumulated enough data about your specific tastes and viewing patterns. Create multiple user profiles for different moods or family members: one for serious dramas, another for light comedies, one for kids. Regularly update your preferences and don\'t be afraid to dislike content to train the algorithm. FreeMovieSearcher\'s AI-powered recommendation engine analyzes deeper patterns beyond surface genres, considering themes, directorial styles, cinematography, and narrative structures.'
-            },
-            {
-                'heading': 'Explore by Mood, Genre, and Specific Viewing Context',
-                'text': 'Sometimes you know the type of emotional experience you want without knowing specific titles to search for. Browse by detailed mood categories like "Feel-Good Films for Rainy Days," "Mind-Bending Thrillers for Late Night," "Epic Adventures for Weekend Binges," or "Comfort Movies for Stressful Times." Genre exploration helps you discover films outside your comfort zone and expand your cinematic palate. Try subgenres you haven\'t explored yet – neo-noir, psychological horror, magical realism, mumblecore, folk horror, or space opera. Use advanced search filters to narrow results by decade (70s grit vs 90s polish), IMDb/Rotten Tomatoes rating thresholds, runtime (short 90-minute films vs epic 3-hour experiences), language for international cinema, certification ratings for family viewing, and award wins/nominations for quality assurance. Consider your viewing context: solo deep-thinking films differ from group comedy picks. Match movies to your energy level – demanding art films require full attention while comfort rewatches work for background viewing.'
-            },
-            {
-                'heading': 'Follow Critics, Communities, and Curated Lists from Trusted Sources',
-                'text': 'Professional film critics offer expert insights informed by decades of viewing and deep understanding of cinematic language, while online communities provide diverse perspectives from passionate fans worldwide. Follow specific critics whose tastes consistently align with yours on platforms like Letterboxd, Rotten Tomatoes, or film Twitter rather than aggregated scores. Join engaged communities like Reddit\'s r/MovieSuggestions, r/TrueFilm, or specialized forums for personalized recommendations and discussions. Read carefully curated year-end best-of lists from multiple respected sources – Sight & Sound, Cahiers du Cinéma, IndieWire, The Guardian. Explore director filmographies – if you love one film, explore their entire catalog. Follow actors whose performances resonate with you. Don\'t automatically dismiss older films as outdated; classic cinema from the 40s through 90s offers incredible experiences that influenced everything that followed and often surpass modern equivalents in craft. Check Criterion Collection releases for restored masterpieces. Trust your instincts ultimately, but remain open to challenging your preferences and discovering surprising favorites through trusted recommendations.'
-            }
-        ]
-    },
-    'movies-based-on-true-stories': {
-        'title': 'Best Movies Based on True Stories - Real Events Transformed Into Incredible Films',
-        'meta_description': 'Experience the best movies based on true stories and real events. From historical dramas to biographical films, discover incredible real-life events, heroes, and moments brought powerfully to screen.',
-        'date': '2024-12-25',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Unique Power of True Stories in Cinema',
-                'text': 'Films based on true events carry unique emotional weight and impact because they actually happened to real people in our world. These movies introduce us to genuine heroes, historic moments that shaped civilization, and inspiring journeys of survival, courage, and transformation. While filmmakers necessarily take creative liberties for dramatic effect, narrative coherence, and time compression, the core truth grounds these stories in reality and gives them authenticity fiction cannot match. True story films serve multiple essential functions: they educate audiences about important historical events and figures, inspire viewers through real examples of human resilience and courage, preserve cultural memory for future generations, and remind us of humanity\'s capacity for both extraordinary evil and remarkable good. They prove that reality can be more compelling, stranger, and more moving than fiction. Whether documenting historical tragedies, celebrating unsung heroes, exposing injustices, or capturing pivotal cultural moments, these films connect us to our shared human story and help us understand the world that shaped our present.'
-            },
-            {
-                'heading': 'Schindler\'s List - Never Forget the Lessons of History',
-                'text': 'Steven Spielberg\'s 1993 masterpiece tells the true story of Oskar Schindler, a German industrialist and unlikely hero who saved over 1,100 Jews during the Holocaust by employing them in his factories. Shot in stark, haunting black and white with only selective color (the girl in red coat symbolizing lost innocence), the film captures the unspeakable horror of genocide while celebrating individual acts of heroism and moral courage in humanity\'s darkest hour. Liam Neeson\'s powerful performance shows Schindler\'s transformation from opportunistic businessman to savior risking everything. Ralph Fiennes embodies evil as Amon Göth. Spielberg\'s unflinching direction refuses to sanitize or sentimentalize, creating an essential historical document that bears witness to atrocity while honoring victims and survivors. The film serves as permanent reminder of what happens when hatred goes unchecked and good people remain silent. It reminds us of humanity\'s capacity for evil while celebrating those who resisted, proving individual actions matter even against overwhelming systemic evil. The film\'s closing scene with real Schindler Jews placing stones on his grave connects past to present powerfully.'
-            },
-            {
-                'heading': 'The Social Network - Building Digital Empire and Its Human Cost',
-                'text': 'David Fincher\'s fast-paced 2010 drama chronicles Facebook\'s founding and the personal betrayals, legal battles, and ethical compromises that accompanied its meteoric rise to becoming the world\'s largest social network. Aaron Sorkin\'s razor-sharp, rapid-fire dialogue and Jesse Eisenberg\'s intense performance as Mark Zuckerberg capture the ambition, genius, social awkwardness, and moral ambiguity behind the social media revolution that transformed how billions communicate. While taking creative liberties with actual events and conversations for dramatic purposes, the film explores universal themes of friendship betrayed, loyalty tested, intellectual property disputes, and success\' personal costs. It\'s simultaneously a period piece capturing specific cultural moment and a prescient examination of social media\'s impact on privacy, relationships, and society. The film asks whether connection-obsessed platforms actually make us more isolated, whether innovation justifies ethical shortcuts, and what we sacrifice for success. Trent Reznor and Atticus Ross\' electronic score perfectly captures the digital age\'s cold efficiency. The Social Network transcends its tech-startup story to examine ambition, belonging, and what happens when brilliant, socially awkward people create tools that reshape human interaction.'
-            },
-            {
-                'heading': 'Why True Stories Resonate and Continue Moving Audiences',
-                'text': 'True story films connect us to real people and actual events in ways fiction cannot fully replicate, creating deeper emotional investment and lasting impact. They preserve important history that might otherwise be forgotten, introduce unsung heroes whose stories deserve telling, and provide real-life role models demonstrating human potential for courage, sacrifice, and transformation. These movies spark essential conversations about ethics, justice, historical responsibility, and human nature. They force us to confront uncomfortable truths about our past and present. While creative interpretation and dramatic compression are necessary for cinema – real life rarely follows three-act structure – the fundamental truth at these stories\' core makes them uniquely powerful educational and emotional experiences. They remind us that extraordinary things happen in our world, that ordinary people can accomplish amazing feats, that history is made by individuals making choices, and that the past directly shapes our present. True story films validate experiences of real people, honor their struggles and triumphs, and ensure their stories survive to inspire future generations. In an age of "post-truth" and manufactured reality, they ground us in verifiable human experience.'
-            }
-        ]
-    },
-    'best-war-movies': {
-        'title': 'Best War Movies - Powerful Stories of Conflict and Human Spirit',
-        'meta_description': 'Experience the best war movies that honor sacrifice and reveal war\'s true cost. From Saving Private Ryan to Apocalypse Now, discover films exploring courage under fire.',
-        'date': '2024-12-08',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'War Cinema - Bearing Witness to History\'s Darkest Hours',
-                'text': 'War films serve as powerful testimonies to human conflict, preserving stories of sacrifice, heroism, and tragedy while examining war\'s devastating impact on individuals, families, and societies. The best war movies avoid glorifying violence, instead presenting honest portrayals of combat\'s brutality, moral complexity, and psychological toll on those who fight. They explore universal themes of courage, brotherhood, duty, and survival while honoring veterans\' experiences and educating audiences about historical conflicts. War cinema ranges from intimate character studies focusing on individual soldiers to epic spectacles depicting massive battles, but the greatest films always remember that behind every uniform is a human being with hopes, fears, and families waiting at home. These films tackle difficult questions about patriotism, following orders versus moral conscience, the fog of war where friend and foe become indistinguishable, and whether any cause justifies war\'s terrible cost in human lives and suffering.'
-            },
-            {
-                'heading': 'Saving Private Ryan - The Brutal Reality of D-Day',
-                'text': 'Steven Spielberg\'s masterpiece opens with the most realistic and harrowing depiction of combat ever filmed - the Omaha Beach landing on D-Day. The 27-minute sequence places viewers in the chaos, terror, and carnage of amphibious assault, using handheld cameras, desaturated colors, and visceral sound design to create immersive experience of warfare\'s hell. Tom Hanks leads squad tasked with finding paratrooper whose three brothers died in combat, raising questions about individual versus greater good. The film balances spectacular battle sequences with intimate character moments, showing how ordinary men find extraordinary courage when everything depends on it. Spielberg refuses to sanitize war\'s reality - soldiers die randomly, heroically, and meaninglessly, often within moments of revealing their humanity through letters from home or stories about peacetime lives. The film honors Greatest Generation\'s sacrifice while acknowledging war\'s waste and trauma that survivors carry forever.'
-            },
-            {
-                'heading': 'Apocalypse Now - The Heart of Darkness in Vietnam',
-                'text': 'Francis Ford Coppola\'s surreal masterpiece adapts Joseph Conrad\'s "Heart of Darkness" to Vietnam War, following Martin Sheen\'s Captain Willard on nightmarish journey upriver to assassinate Marlon Brando\'s rogue Colonel Kurtz. The film presents war as descent into madness, with each stop revealing new horrors and moral decay. Robert Duvall\'s napalm-loving cavalry colonel represents military\'s disconnection from reality, while Kurtz embodies what happens when civilization\'s restraints completely disappear. Coppola\'s production became legendary ordeal - filming in Philippines during typhoons, Brando arriving unprepared and overweight, Sheen suffering heart attack - but resulting film captures Vietnam\'s psychological impact on American consciousness. The movie\'s hypnotic, hallucinogenic atmosphere reflects war\'s ability to shatter minds and souls, showing how violence corrupts everyone it touches, victor and victim alike. "Apocalypse Now" remains definitive statement on Vietnam\'s tragedy and imperialism\'s ultimate futility.'
-            },
-            {
-                'heading': 'Why War Movies Matter - Preserving Memory and Warning Future',
-                'text': 'War films serve crucial cultural functions beyond entertainment, preserving memories of conflicts that shaped history, honoring those who served and died, and educating new generations about war\'s true cost in human terms. They provide platforms for veterans to see their experiences reflected and validated, helping process trauma through art while ensuring their stories survive. The best war movies serve as warnings, showing young people seduced by military glory what combat actually entails - not adventure and heroism, but terror, randomness, and irrevocable loss of innocence. These films explore moral complexity of warfare, where good and evil blur, where following orders conflicts with conscience, where survival often requires abandoning civilized values. They remind us that war\'s true tragedy isn\'t strategic failure but individual lives cut short, families destroyed, and societies traumatized for generations. In age where conflicts seem distant and abstract, war movies make costs personal and immediate, fostering empathy and understanding while honoring those who paid ultimate price for others\' freedom.'
-            }
-        ]
-    },
-    'best-western-movies': {
-        'title': 'Best Western Movies - Classic Tales of the American Frontier',
-        'meta_description': 'Saddle up with the best western movies of all time. From The Good, The Bad and The Ugly to Unforgiven, explore films that defined the American frontier spirit.',
-        'date': '2024-12-06',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Western Genre - Mythology of the American Frontier',
-                'text': 'Western films created America\'s founding mythology, romanticizing the frontier era while exploring themes of justice, individualism, civilization versus wilderness, and the cost of progress. The genre peaked in Hollywood\'s golden age, with directors like John Ford creating iconic imagery of Monument Valley landscapes, lone gunfighters, cattle drives, and frontier towns that defined American identity for generations. Westerns evolved from simple good-versus-evil tales to complex moral dramas examining racism, violence, and the destruction of Native American cultures. The best westerns use frontier settings to explore universal themes - what happens when laws fail, how communities form in hostile environments, whether violence can ever truly solve problems, and what price we pay for civilization. Modern westerns often deconstruct the genre\'s myths, revealing darker truths about American expansion while maintaining the epic scope and moral clarity that made westerns appealing. The genre influenced filmmaking worldwide, with Italian "spaghetti westerns" and Japanese samurai films sharing similar themes of honor, duty, and violent justice in lawless lands.'
-            },
-            {
-                'heading': 'The Good, The Bad and The Ugly - Sergio Leone\'s Epic Masterpiece',
-                'text': 'Sergio Leone\'s 1966 masterpiece represents the western genre\'s artistic peak, combining Clint Eastwood\'s iconic Man with No Name, Ennio Morricone\'s legendary score, and Leone\'s revolutionary filmmaking style. The film follows three gunfighters pursuing buried Confederate gold during Civil War chaos, creating epic tale of greed, betrayal, and survival. Leone\'s extreme close-ups, wide shots of vast landscapes, and operatic pacing elevated western conventions into high art. Morricone\'s score, featuring whistles, gunshots, and electric guitars, became synonymous with western genre itself. The film\'s famous final three-way standoff remains one of cinema\'s most tension-filled sequences, with Leone building suspense through editing, music, and Eastwood\'s steely presence. While ostensibly about treasure hunt, the film examines war\'s waste and human greed\'s destructive power. Leone\'s vision influenced countless filmmakers, proving that westerns could be both popular entertainment and serious artistic statements about violence, morality, and American mythology\'s dark underbelly.'
-            },
-            {
-                'heading': 'Unforgiven - Deconstructing the Western Hero',
-                'text': 'Clint Eastwood\'s 1992 masterpiece serves as both culmination and deconstruction of his western career, examining violence\'s true cost and questioning heroic myths the genre traditionally celebrated. Eastwood plays aging gunfighter William Munny, haunted by violent past and reluctantly returning to killing for money to support his children. The film methodically destroys romantic notions of the Old West, showing prostitutes\' harsh reality, lawmen\'s corruption, and violence\'s permanent psychological damage. Gene Hackman\'s sadistic sheriff represents authority\'s brutal face, while Morgan Freeman and Richard Harris provide counterpoints to Eastwood\'s tortured protagonist. Eastwood\'s direction emphasizes consequences - every death matters, every violent act leaves scars, and heroic reputations often hide terrible truths. The film won four Oscars, including Best Picture, proving westerns could still resonate with modern audiences when they honestly confronted genre\'s inherent contradictions. "Unforgiven" serves as meditation on aging, regret, and whether redemption is possible for those who\'ve lived by violence, making it both thrilling entertainment and profound moral statement.'
-            },
-            {
-                'heading': 'Why Westerns Endure - Timeless Themes in Period Settings',
-                'text': 'Western films endure because they explore fundamental human conflicts - individual versus community, civilization versus wildness, justice versus law, tradition versus progress - through clear moral frameworks that resonate across cultures and generations. The frontier setting strips away modern complexities, reducing conflicts to essential elements where character is revealed through action under pressure. Westerns celebrate self-reliance and individual courage while acknowledging civilization\'s benefits and costs, creating tension between freedom and security that remains relevant today. The genre\'s visual language - vast landscapes dwarfing human figures, isolated towns surrounded by wilderness, showdowns on empty streets - creates powerful metaphors for loneliness, moral choice, and standing up for principles regardless of consequences. Modern westerns have expanded beyond American settings, with films like "The Seven Samurai" and "Mad Max" using western structures to explore similar themes in different contexts. The genre\'s influence extends beyond cinema into literature, music, and popular culture, creating shared mythology about courage, justice, and finding meaning in harsh, unforgiving worlds where only character matters.'
-            }
-        ]
-    },
-    'best-biographical-movies': {
-        'title': 'Best Biographical Movies - True Stories of Extraordinary Lives',
-        'meta_description': 'Discover the best biographical movies telling true stories of remarkable people. From Gandhi to The Social Network, explore films celebrating human achievement and struggle.',
-        'date': '2024-12-04',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Biographical Cinema - Bringing History\'s Giants to Life',
-                'text': 'Biographical films, or biopics, face unique challenges in condensing entire lifetimes into feature-length narratives while remaining truthful to historical facts and the spirit of their subjects. The best biopics find universal themes in specific lives, showing how extraordinary individuals navigate ordinary human struggles - doubt, failure, relationships, mortality - while achieving greatness that changes the world. These films educate audiences about historical figures who shaped civilization, preserving their legacies for new generations while examining what drives people to transcend limitations and pursue seemingly impossible dreams. Biopics range from cradle-to-grave epics spanning decades to focused character studies examining crucial periods when subjects faced defining moments. The genre demands exceptional performances from actors who must embody real people with distinct mannerisms, speech patterns, and personalities while avoiding mere impersonation to find deeper truths about human nature and historical significance.'
-            },
-            {
-                'heading': 'Gandhi - Richard Attenborough\'s Epic of Non-Violence',
-                'text': 'Richard Attenborough\'s 1982 masterpiece chronicles Mahatma Gandhi\'s transformation from young lawyer to leader of Indian independence movement, spanning over 50 years and multiple continents. Ben Kingsley\'s transformative performance earned him the Oscar, capturing Gandhi\'s evolution from westernized attorney experiencing racism in South Africa to ascetic spiritual leader organizing massive civil disobedience campaigns. The film presents Gandhi\'s philosophy of non-violent resistance as both political strategy and moral imperative, showing how one man\'s principles could inspire millions and topple an empire. Attenborough\'s epic scope includes crowd scenes with hundreds of thousands of extras recreating historic events like the Salt March and Quit India movement. The film doesn\'t shy away from Gandhi\'s complexities - his difficult relationships with family, moments of doubt, and political compromises required for independence. "Gandhi" demonstrates how biographical cinema can educate while inspiring, showing how individual moral courage can create social change and how non-violence can be more powerful than any weapon.'
-            },
-            {
-                'heading': 'Modern Biopics - Contemporary Lives and Recent History',
-                'text': 'Contemporary biographical films tackle recent history and living subjects, often focusing on public figures whose stories shaped modern culture, technology, and society. "Steve Jobs" examines the Apple co-founder through three product launches, with Michael Fassbender capturing Jobs\' perfectionism and interpersonal difficulties. Aaron Sorkin\'s script explores creativity\'s costs and innovation\'s human price. "The Theory of Everything" presents Stephen Hawking\'s relationship with first wife Jane, balancing his scientific achievements with personal struggles against ALS. Eddie Redmayne\'s physical transformation earned him an Oscar. "Bohemian Rhapsody" celebrates Queen\'s music while examining Freddie Mercury\'s journey from shy immigrant to rock god, with Rami Malek\'s electrifying performance anchoring the narrative. "Vice" takes unconventional approach to Dick Cheney\'s political career, using dark comedy to examine power\'s corrupting influence. These films prove that recent subjects can be as compelling as historical figures, especially when they shaped the world we currently inhabit and their influence continues affecting our daily lives.'
-            },
-            {
-                'heading': 'Why Biographical Films Inspire and Educate',
-                'text': 'Biographical movies serve dual purposes of entertainment and education, introducing audiences to remarkable individuals whose achievements, struggles, and philosophies offer lessons for contemporary life. They preserve important stories that might otherwise be forgotten, ensuring that future generations understand the people who shaped history, advanced human knowledge, and fought for justice and progress. Biopics demonstrate that extraordinary people are fundamentally human - they doubt themselves, make mistakes, face seemingly impossible obstacles, and sometimes fail before succeeding. This humanity makes their achievements more inspiring rather than less, showing that greatness is possible for anyone willing to persist despite difficulties. These films also provide safe spaces to examine controversial figures and complex historical periods, allowing audiences to understand different perspectives and learn from past mistakes. The best biographical films transcend mere historical record-keeping to explore universal themes of ambition, sacrifice, love, loss, and the drive to leave lasting legacies. They remind us that individual actions matter, that one person can change the world, and that every life contains potential for greatness if we have courage to pursue our deepest convictions despite opposition, ridicule, or seemingly insurmountable obstacles.'
-            }
-        ]
-    },
-    'best-sports-movies': {
-        'title': 'Best Sports Movies - Inspiring Stories of Athletic Achievement',
-        'meta_description': 'Get motivated with the best sports movies of all time. From Rocky to Field of Dreams, discover films celebrating the triumph of human spirit through athletics.',
-        'date': '2024-12-02',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Sports Cinema - More Than Games, Stories of Human Spirit',
-                'text': 'Sports films transcend athletic competition to explore universal themes of perseverance, teamwork, overcoming adversity, and pursuing dreams despite overwhelming odds. The best sports movies use athletic frameworks to examine broader human experiences - class struggle, racial integration, personal redemption, family relationships, and what it means to never give up. These films appeal to both sports fans and general audiences because they tap into fundamental desires for triumph, justice, and proof that hard work can overcome natural disadvantages. Sports movies often follow similar narrative arcs - underdogs facing superior opponents, teams overcoming internal divisions, individuals conquering personal demons through athletic achievement - but the best examples find fresh approaches to familiar formulas. The genre celebrates not just winning, but effort, dignity in defeat, and growth through challenge. Great sports films understand that the most important victories happen inside characters\' hearts and minds, where self-doubt transforms into confidence and individuals discover reserves of strength they never knew existed.'
-            },
-            {
-                'heading': 'Rocky - The Ultimate Underdog Story',
-                'text': 'Sylvester Stallone\'s 1976 masterpiece created the template for all subsequent underdog sports films, following small-time Philadelphia boxer Rocky Balboa getting an unlikely shot at the heavyweight championship. Stallone wrote the script in three days after watching Muhammad Ali fight Chuck Wepner, creating a character who represented every working-class dreamer told they weren\'t good enough. The film\'s genius lies in redefining victory - Rocky doesn\'t need to win the fight, just "go the distance" and prove he belongs in the ring with Apollo Creed. This shifts focus from external achievement to internal growth, making Rocky\'s moral victory more satisfying than any knockout. The training montages, especially running up the Philadelphia Museum steps, became iconic imagery of determination and self-improvement. Talia Shire\'s Adrian provides emotional anchor, transforming from shy pet store clerk into confident woman supporting her man\'s dreams. The film earned 10 Oscar nominations and won Best Picture, proving that simple stories told with heart and authenticity could compete with big-budget spectacles. Rocky spawned seven sequels and countless imitators but remains the purest expression of American dream mythology.'
-            },
-            {
-                'heading': 'Team Sports and Ensemble Stories',
-                'text': 'Team sports films explore how diverse individuals unite toward common goals, overcoming personal conflicts and social divisions through shared purpose and mutual dependence. "Hoosiers" tells the true story of small-town Indiana basketball team reaching state championship, with Gene Hackman\'s coach bringing together misfits and outcasts. The film captures basketball\'s cultural importance in rural Indiana while examining second chances and redemption. "Remember the Titans" addresses racial integration through newly integrated high school football team in 1970s Virginia, with Denzel Washington\'s coach forcing black and white players to respect each other. "The Mighty Ducks" proves that sports films can work for family audiences, following lawyer coaching youth hockey team and learning that winning isn\'t everything. "Field of Dreams" uses baseball as gateway to fantasy, with Kevin Costner building ballpark to commune with deceased father and childhood heroes. "A League of Their Own" celebrates women\'s professional baseball during World War II, combining comedy with serious examination of gender roles and women\'s capabilities. These films demonstrate sports\' power to break down barriers, build character, and create communities where individual success depends on collective effort.'
-            },
-            {
-                'heading': 'Why Sports Movies Motivate and Inspire Us',
-                'text': 'Sports films resonate because they dramatize struggles everyone faces - self-doubt, fear of failure, pressure to quit when things get difficult - while providing clear metaphors for life\'s challenges and rewards for persistence. They celebrate meritocracy\'s ideal that effort and character matter more than background or natural advantages, offering hope that underdogs can succeed through dedication and hard work. Sports movies tap into primal desires for tribal belonging and vicarious achievement, allowing audiences to experience triumph through protagonists\' victories. They also provide safe spaces to explore defeat and disappointment, showing that losing gracefully can be as admirable as winning and that setbacks often lead to comebacks. The genre\'s emphasis on training and preparation resonates with anyone pursuing difficult goals, demonstrating that success requires sacrifice, discipline, and willingness to push beyond comfort zones. Sports films remind us that competition reveals character, that teammates become family, and that games matter because they teach life lessons about cooperation, leadership, and standing up under pressure. In increasingly sedentary and individualistic society, sports movies preserve values of physical achievement, community belonging, and the simple joy of giving everything you have toward shared goals with people who depend on you and believe in your potential.'
-            }
-        ]
-    },
-    'best-musical-movies': {
-        'title': 'Best Musical Movies - Songs, Dance, and Spectacular Entertainment',
-        'meta_description': 'Sing along with the best musical movies of all time. From Singin\' in the Rain to La La Land, discover films where music tells the story and dance expresses emotion.',
-        'date': '2024-11-30',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Musical Cinema - Where Song and Story Become One',
-                'text': 'Musical films represent cinema\'s most artificial yet emotionally direct art form, where characters naturally burst into song and elaborate dance numbers advance narrative and reveal inner feelings. The best musicals create worlds where music feels organic, where songs emerge from emotional necessity rather than arbitrary plot requirements, and where spectacular production numbers enhance rather than interrupt storytelling flow. Musicals range from realistic dramas with occasional songs to full fantasy spectacles where every line could potentially become melody. The genre demands total commitment from audiences - willingness to accept convention where people sing instead of speak, where dance replaces dialogue, where emotional climaxes happen in three-part harmony. Great musicals understand that songs must serve story, revealing character motivations, advancing plot, or exploring themes that spoken dialogue cannot express as powerfully. They balance intimate character moments with show-stopping spectacles, ensuring that even the biggest production numbers feel emotionally motivated and dramatically necessary.'
-            },
-            {
-                'heading': 'Singin\' in the Rain - The Joyful Peak of Hollywood Musicals',
-                'text': 'Gene Kelly and Stanley Donen\'s 1952 masterpiece represents Hollywood musical filmmaking at its absolute peak, combining brilliant songs, innovative choreography, and loving satire of film industry\'s transition from silent pictures to "talkies." Kelly stars as silent film star whose career faces crisis when sound arrives, forcing him to adapt while romancing aspiring actress Debbie Reynolds. The film\'s genius lies in using this backdrop to explore creativity, artistic integrity, and entertainment\'s power to lift spirits during difficult times. Kelly\'s title number, performed in actual rain with no special effects, remains one of cinema\'s most joyful expressions of pure happiness translated into movement. Donald O\'Connor\'s "Make \'Em Laugh" showcases physical comedy brilliance, while "Good Morning" demonstrates Kelly and Donen\'s choreographic innovation. The film works simultaneously as romantic comedy, show business satire, and celebration of musical theatre\'s possibilities. Its optimistic spirit, coupled with technical excellence, makes "Singin\' in the Rain" not just the greatest musical but one of cinema\'s most purely entertaining films, proving that artificial conventions can create authentic emotional experiences.'
-            },
-            {
-                'heading': 'Modern Musicals - Reviving a Classic Form',
-                'text': 'Contemporary filmmakers have revitalized the musical genre by adapting Broadway shows for screen while creating original film musicals that speak to modern audiences. "La La Land" pays homage to classic Hollywood musicals while examining artistic ambition and romantic sacrifice in contemporary Los Angeles. Ryan Gosling and Emma Stone\'s chemistry drives story of jazz pianist and aspiring actress whose careers pull them apart. Damien Chazelle\'s direction captures both intimate moments and spectacular sequences like the planetarium dance. "Chicago" successfully adapted Broadway hit into film, with Rob Marshall using rapid editing and fantasy sequences to make stage conventions work cinematically. Catherine Zeta-Jones, Renée Zellweger, and Richard Gere deliver powerhouse performances in story of murder, fame, and corruption in 1920s Chicago. "Mamma Mia!" proves original movie musicals can succeed by building narrative around ABBA\'s catalog, creating feel-good entertainment that celebrates love, family, and second chances. "The Greatest Showman" uses P.T. Barnum\'s story to explore themes of acceptance and showmanship, with Hugh Jackman leading energetic musical numbers. These films demonstrate that musical format remains viable when filmmakers understand how to balance artifice with authenticity.'
-            },
-            {
-                'heading': 'Why Musical Movies Lift Our Spirits',
-                'text': 'Musical films provide unique emotional experiences by combining multiple art forms - music, dance, acting, cinematography - into unified expressions that can convey feelings more powerfully than any single medium alone. They offer pure escapism into worlds where problems can be resolved through song, where love can be declared in harmony, where conflicts explode into elaborate dance battles instead of violence. Musicals tap into fundamental human impulses to sing and dance when happy, to use rhythm and melody to process emotions too complex for words alone. They preserve theatrical traditions while expanding possibilities through cinema\'s technical capabilities - elaborate sets, exotic locations, impossible camera movements that stage productions cannot achieve. The genre celebrates optimism and community, showing diverse groups uniting through shared musical expression, finding joy despite adversity, and believing that creative expression can overcome any obstacle. Musical movies remind us that life contains moments of spontaneous joy worth celebrating, that love deserves grand gestures, and that sometimes the only appropriate response to overwhelming happiness is to sing and dance until the feeling subsides into manageable contentment.'
-            }
-        ]
-    },
-    'best-indie-movies': {
-        'title': 'Best Independent Movies - Hidden Gems and Artistic Masterpieces',
-        'meta_description': 'Discover the best indie movies that push creative boundaries. From Pulp Fiction to Moonlight, explore independent films that changed cinema forever.',
-        'date': '2024-11-28',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Independent Cinema - Art Over Commerce',
-                'text': 'Independent films represent cinema at its most creative and uncompromising, freed from studio constraints to explore unconventional stories, experimental techniques, and challenging themes that mainstream Hollywood often avoids. Indie movies prioritize artistic vision over commercial appeal, allowing filmmakers to take risks with narrative structure, character development, and controversial subject matter. These films often work with smaller budgets, forcing creative solutions that frequently result in more innovative and memorable cinema than big-budget productions. The best independent films discover fresh voices, launch careers of future auteurs, and prove that compelling storytelling matters more than expensive special effects or A-list celebrities.'
-            },
-            {
-                'heading': 'Pulp Fiction - Revolutionary Independent Filmmaking',
-                'text': 'Quentin Tarantino\'s 1994 masterpiece revolutionized independent cinema with its nonlinear narrative, razor-sharp dialogue, and pop culture-saturated style. The film interweaves multiple storylines featuring hitmen, boxers, and criminals in Los Angeles underworld, creating complex tapestry where seemingly unrelated events connect in surprising ways. Tarantino\'s genius lies in making violence both horrifying and darkly comedic, creating characters who are simultaneously despicable and charismatic. John Travolta\'s career-reviving performance as Vincent Vega, Samuel L. Jackson\'s philosophical Jules Winnfield, and Uma Thurman\'s mysterious Mia Wallace became instantly iconic. The film proved that independent movies could achieve massive commercial success without compromising artistic integrity.'
-            },
-            {
-                'heading': 'Modern Indie Masterpieces',
-                'text': '"Moonlight" tells the coming-of-age story of a young gay Black man in three chapters, exploring identity, sexuality, and masculinity with unprecedented sensitivity. Barry Jenkins\' direction and stunning cinematography create intimate portrait of self-discovery. "Lady Bird" captures the universal experience of mother-daughter relationships through Greta Gerwig\'s semi-autobiographical story of Sacramento teenager navigating senior year. Saoirse Ronan and Laurie Metcalf deliver career-best performances in this perfectly observed comedy-drama. "Parasite" blends genres to create dark social satire about class inequality in South Korea, earning historic Oscar wins including Best Picture.'
-            },
-            {
-                'heading': 'Why Independent Films Matter',
-                'text': 'Independent movies provide essential counterbalance to mainstream entertainment, offering diverse perspectives, experimental storytelling techniques, and willingness to tackle difficult subjects that commercial cinema often ignores. They preserve filmmaking as art form rather than just product, demonstrating that movies can challenge, provoke, and inspire audiences beyond mere entertainment. Indie films often launch careers of innovative directors, writers, and actors who bring fresh voices to cinema, ensuring the medium continues evolving and growing. They prove that compelling stories can emerge from any background, that creativity trumps budget, and that audiences hunger for authentic, original experiences that speak to their deeper humanity.'
-            }
-        ]
-    },
-    'best-foreign-films': {
-        'title': 'Best Foreign Films - International Cinema Masterpieces',
-        'meta_description': 'Explore the best foreign films from around the world. From Seven Samurai to Amélie, discover international cinema that transcends language barriers.',
-        'date': '2024-11-26',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'World Cinema - Stories Beyond Hollywood',
-                'text': 'Foreign films open windows into different cultures, offering perspectives and storytelling traditions that expand our understanding of human experience beyond American and British cinema. International movies often approach universal themes through unique cultural lenses, providing fresh insights into love, death, family, politics, and spirituality. The best foreign films transcend language barriers through visual storytelling, emotional authenticity, and themes that speak to shared human experiences regardless of nationality or background.'
-            },
-            {
-                'heading': 'Seven Samurai - Kurosawa\'s Epic Masterpiece',
-                'text': 'Akira Kurosawa\'s 1954 epic follows seven masterless samurai defending farming village from bandits, creating template for team-building narratives that influenced countless films including "The Magnificent Seven" and "Star Wars." The three-hour epic showcases Kurosawa\'s innovative camera techniques, including multiple cameras capturing action from different angles and telephoto lenses creating depth and movement. Each samurai has distinct personality and fighting style, making their gradual acceptance by villagers and ultimate sacrifice emotionally resonant. The film explores themes of honor, duty, class conflict, and changing times as traditional warrior culture faces obsolescence.'
-            },
-            {
-                'heading': 'European Art Cinema Excellence',
-                'text': '"8½" represents Federico Fellini\'s surreal meditation on creativity and artistic block, following film director struggling to complete his latest project while confronting memories, fantasies, and relationships. "Amélie" captures Parisian whimsy through Jean-Pierre Jeunet\'s visual imagination and Audrey Tautou\'s luminous performance as shy waitress discovering joy in helping others find love. "Cinema Paradiso" nostalgically celebrates movie-going experience through boy\'s friendship with projectionist in post-war Italian village. These films demonstrate European cinema\'s artistic ambition and cultural specificity.'
-            },
-            {
-                'heading': 'Why Foreign Films Enrich Cinema',
-                'text': 'International cinema preserves diverse storytelling traditions, ensuring that movies reflect full spectrum of human experience rather than just Western perspectives. Foreign films challenge audiences to engage more actively through subtitles, different pacing, and unfamiliar cultural references, creating more rewarding viewing experiences. They demonstrate that great stories exist everywhere, that different cultures offer unique insights into universal themes, and that cinema works best when it embraces rather than eliminates cultural differences. Foreign films remind us that art transcends borders and that our shared humanity appears in countless beautiful variations worldwide.'
-            }
-        ]
-    },
-    'best-family-movies': {
-        'title': 'Best Family Movies - Entertainment for All Ages',
-        'meta_description': 'Enjoy the best family movies that entertain both kids and adults. From The Lion King to Finding Nemo, discover films perfect for family movie nights.',
-        'date': '2024-11-24',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Family Cinema - Bringing Generations Together',
-                'text': 'Family films serve the challenging task of entertaining multiple generations simultaneously, offering layers of meaning that engage children through colorful characters and simple stories while providing adults with sophisticated humor, emotional depth, and nostalgic references. The best family movies avoid talking down to young audiences while maintaining innocence and wonder that adults often lose. They create shared experiences where families can laugh together, discuss important themes, and build memories around beloved characters and memorable quotes. Great family films balance entertainment with gentle life lessons about friendship, courage, kindness, and growing up.'
-            },
-            {
-                'heading': 'Disney Renaissance and Pixar Innovation',
-                'text': '"The Lion King" combines Shakespeare\'s "Hamlet" with African wildlife, creating coming-of-age epic about responsibility, identity, and accepting one\'s destiny. The film\'s emotional weight, stunning animation, and Elton John\'s memorable songs made it Disney\'s peak achievement. "Finding Nemo" explores parental protection versus children\'s independence through clownfish father\'s journey across ocean to rescue his adventurous son. Pixar\'s stunning underwater animation and emotional storytelling elevated family entertainment to new artistic heights. "Beauty and the Beast" became first animated film nominated for Best Picture Oscar, proving that family movies could achieve critical acclaim alongside commercial success.'
-            },
-            {
-                'heading': 'Live-Action Family Classics',
-                'text': '"The Princess Bride" perfectly balances adventure, romance, and comedy through grandfather reading fairy tale to sick grandson. The film works on multiple levels - children enjoy swashbuckling action while adults appreciate clever dialogue and genre parody. "E.T." captures childhood wonder through Steven Spielberg\'s story of boy befriending stranded alien. The film\'s emotional power comes from viewing adult world through child\'s perspective, making family relationships and imagination central to narrative. "The Goonies" celebrates friendship and adventure as kids search for pirate treasure to save their neighborhood from developers.'
-            },
-            {
-                'heading': 'Why Family Movies Create Lasting Bonds',
-                'text': 'Family films provide rare opportunities for shared entertainment in increasingly fragmented media landscape where family members often consume different content on personal devices. They create common cultural references that bind families together across generations, allowing parents to share favorite childhood movies with their own children. The best family movies address universal themes - growing up, finding belonging, overcoming fears - in ways that resonate with viewers regardless of age. They remind us that wonder and imagination remain important throughout life, that simple stories told with heart can be more powerful than complex narratives, and that entertainment works best when it brings people together rather than isolating them.'
-            }
-        ]
-    },
-    'movie-reviews-2024': {
-        'title': 'Movie Reviews 2024 - Best Films of the Year',
-        'meta_description': 'Read comprehensive movie reviews of 2024\'s best films. From blockbusters to indie gems, discover which movies are worth watching this year.',
-        'date': '2024-11-22',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': '2024 Film Landscape - A Year of Cinematic Excellence',
-                'text': '2024 proved to be exceptional year for cinema, with blockbuster franchises delivering surprising depth while independent films pushed creative boundaries and international movies gained unprecedented recognition. The year saw return of beloved characters in sequels that respected their legacy while introducing fresh perspectives. Streaming platforms continued reshaping distribution, allowing smaller films to find audiences while traditional theaters showcased spectacular visual experiences that demanded big-screen viewing. The year balanced nostalgia with innovation, familiar genres with experimental storytelling, and commercial entertainment with artistic ambition.'
-            },
-            {
-                'heading': 'Blockbuster Highlights and Franchise Successes',
-                'text': 'Major studios delivered crowd-pleasing entertainment that combined spectacle with emotional storytelling. Superhero films evolved beyond simple good-versus-evil narratives to explore complex themes of identity, responsibility, and sacrifice. Action movies embraced practical effects alongside CGI to create visceral experiences that felt grounded in reality. Horror films elevated genre conventions through psychological depth and social commentary. Science fiction movies tackled contemporary issues through futuristic settings, creating thoughtful entertainment that entertained while provoking discussion about technology, environment, and humanity\'s future.'
-            },
-            {
-                'heading': 'Independent Film Breakthroughs',
-                'text': 'Independent cinema flourished in 2024, with breakthrough performances from emerging actors and innovative direction from both established auteurs and promising newcomers. These films tackled diverse subjects from intimate character studies to ambitious genre experiments, proving that original storytelling remained vital to cinema\'s health. Festival circuits celebrated movies that took creative risks, addressed underrepresented perspectives, and found new ways to explore universal themes through specific cultural contexts.'
-            },
-            {
-                'heading': 'What 2024 Movies Taught Us',
-                'text': '2024\'s best films demonstrated that audiences hunger for both spectacular entertainment and meaningful storytelling, that diverse voices strengthen rather than weaken cinema, and that technology serves creativity rather than replacing it. The year proved that movies remain powerful medium for processing contemporary anxieties, celebrating human resilience, and imagining better futures. Whether through blockbuster spectacles or intimate dramas, 2024\'s films reminded us why cinema matters in an age of constant digital distraction.'
-            }
-        ]
-    },
-    'classic-movies-to-watch': {
-        'title': 'Classic Movies to Watch - Timeless Films Every Movie Lover Should See',
-        'meta_description': 'Discover essential classic movies that defined cinema history. From Citizen Kane to Gone with the Wind, explore timeless films that remain relevant today.',
-        'date': '2024-11-20',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Why Classic Movies Matter in Modern Times',
-                'text': 'Classic films provide foundation for understanding cinema as art form, showcasing techniques, themes, and performances that influenced generations of filmmakers and continue shaping movies today. These timeless works demonstrate that great storytelling transcends technological limitations, that compelling characters and universal themes remain relevant regardless of when films were made. Classic movies offer historical perspectives on social issues, cultural values, and artistic movements while proving that black-and-white cinematography, practical effects, and dialogue-driven narratives can be more powerful than modern CGI spectacles.'
-            },
-            {
-                'heading': 'Citizen Kane - The Greatest Film Ever Made',
-                'text': 'Orson Welles\' 1941 masterpiece consistently ranks as cinema\'s greatest achievement, revolutionizing filmmaking through innovative camera techniques, non-linear narrative structure, and complex character study of media mogul Charles Foster Kane. The film introduced deep-focus photography, allowing multiple planes of action within single shots, and bold camera movements that became standard cinematic language. Welles\' direction and performance, combined with Gregg Toland\'s revolutionary cinematography, created visual poetry that tells story of American ambition, corruption, and the emptiness that can accompany worldly success.'
-            },
-            {
-                'heading': 'Golden Age Hollywood Masterpieces',
-                'text': '"Gone with the Wind" remains epic romance and historical drama that captured Civil War\'s impact on Southern society through Scarlett O\'Hara\'s determination to survive and protect her land. Despite problematic racial politics requiring historical context, the film\'s technical achievements, sweeping scope, and Vivien Leigh\'s iconic performance make it essential viewing. "Casablanca" perfected wartime romance through Humphrey Bogart and Ingrid Bergman\'s star-crossed lovers, creating quotable dialogue and moral complexity that resonates across generations.'
-            },
-            {
-                'heading': 'Building Cultural Literacy Through Classic Cinema',
-                'text': 'Classic movies provide shared cultural references that appear throughout literature, art, and contemporary films, making them essential for understanding how stories connect across time and media. They demonstrate evolution of filmmaking techniques, showing how innovative directors solved technical challenges that paved way for modern cinema. Classic films remind us that human experiences - love, loss, ambition, betrayal - remain constant even as society changes, proving that great art transcends its historical moment to speak to eternal aspects of human nature. They offer wisdom about life\'s complexities through stories that have entertained and enlightened audiences for decades.'
-            }
-        ]
-    },
-    'movie-streaming-guide': {
-        'title': 'Movie Streaming Guide 2024 - Where to Watch Your Favorite Films',
-        'meta_description': 'Find where to stream movies with our complete 2024 streaming guide. Compare Netflix, Amazon Prime, Disney+, and other platforms for the best movie content.',
-        'date': '2024-11-18',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Streaming Wars - Which Platform Offers the Best Movies',
-                'text': 'The streaming landscape has become increasingly complex with multiple platforms competing for subscribers through exclusive content, original films, and vast libraries of classic movies. Each service targets different demographics and preferences - Netflix focuses on global content and algorithm-driven recommendations, Disney+ specializes in family entertainment and blockbuster franchises, HBO Max curates prestige content and acclaimed originals, while Amazon Prime Video combines commercial entertainment with art-house films. Understanding each platform\'s strengths helps viewers choose services that match their viewing habits and interests.'
-            }
-        ]
-    },
-    'upcoming-movies-2025': {
-        'title': 'Most Anticipated Upcoming Movies 2025 - Films to Watch Next Year',
-        'meta_description': 'Get excited for upcoming movies in 2025. From superhero sequels to original dramas, discover the most anticipated films arriving next year.',
-        'date': '2024-11-16',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': '2025 Movie Preview - What to Expect from Next Year',
-                'text': '2025 promises exciting lineup of films spanning all genres, from highly anticipated franchise installments to original stories from acclaimed directors. Studios are balancing proven properties with fresh concepts, offering both comfort food for franchise fans and challenging cinema for adventurous viewers. The year will test whether theatrical experiences can compete with streaming convenience while showcasing technological innovations in filmmaking.'
-            }
-        ]
-    },
-    'movie-awards-season': {
-        'title': 'Movie Awards Season Guide - Oscars, Golden Globes and Film Festivals',
-        'meta_description': 'Navigate movie awards season with our complete guide to Oscars, Golden Globes, and major film festivals. Discover the films getting critical acclaim.',
-        'date': '2024-11-14',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Understanding Awards Season and Its Impact on Cinema',
-                'text': 'Awards season transforms film industry calendar, influencing release strategies, marketing campaigns, and public discourse about cinema. From festival premieres to Oscar ceremonies, awards create narratives about artistic achievement while shaping cultural conversations about important films. Understanding awards can help viewers discover exceptional movies they might otherwise miss.'
-            }
-        ]
-    },
-    'movie-trivia-facts': {
-        'title': 'Amazing Movie Trivia and Behind-the-Scenes Facts',
-        'meta_description': 'Discover fascinating movie trivia and behind-the-scenes facts about your favorite films. From production secrets to casting stories, explore cinema history.',
-        'date': '2024-11-12',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Behind the Magic - Fascinating Movie Production Stories',
-                'text': 'Every great film has stories behind the camera that are often as compelling as what appears on screen. From casting decisions that changed everything to technical innovations that solved impossible problems, movie production is filled with creativity, compromise, and occasional chaos that shapes final results in unexpected ways.'
-            }
-        ]
-    },
-    'movie-quotes-memorable': {
-        'title': 'Most Memorable Movie Quotes That Became Cultural Phenomena',
-        'meta_description': 'Explore the most memorable movie quotes in cinema history. From "Here\'s looking at you, kid" to "May the Force be with you," discover iconic dialogue.',
-        'date': '2024-11-10',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Power of Memorable Dialogue in Cinema',
-                'text': 'Great movie quotes transcend their original contexts to become part of everyday language, expressing complex emotions and universal truths in memorable phrases that resonate across generations. The best dialogue captures character essence while advancing plot, creating lines that feel both specific to their stories and universally applicable to human experience.'
-            }
-        ]
-    },
-    'movie-soundtracks-best': {
-        'title': 'Best Movie Soundtracks That Enhanced Cinematic Storytelling',
-        'meta_description': 'Discover the best movie soundtracks that elevated films to new heights. From Hans Zimmer epics to John Williams classics, explore music that makes movies memorable.',
-        'date': '2024-11-08',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'How Great Soundtracks Elevate Movies Beyond Visual Storytelling',
-                'text': 'Movie soundtracks serve as emotional guides, creating atmosphere, building tension, and enhancing dramatic moments in ways that dialogue and visuals cannot achieve alone. Great composers understand how music interacts with story, creating themes that become inseparable from characters and moments they represent.'
-            }
-        ]
-    },
-    'movie-franchises-ranked': {
-        'title': 'Best Movie Franchises Ranked - From Marvel to Star Wars',
-        'meta_description': 'Discover the best movie franchises of all time ranked by quality, impact, and entertainment value. From superhero sagas to epic space operas.',
-        'date': '2024-11-06',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'What Makes a Great Movie Franchise',
-                'text': 'Successful movie franchises balance familiarity with surprise, maintaining consistent characters and themes while finding new stories to tell within established worlds. The best franchises evolve with their audiences while respecting what made original films special, creating mythology that spans generations.'
-            }
-        ]
-    },
-    'movie-directors-greatest': {
-        'title': 'Greatest Movie Directors Who Shaped Cinema History',
-        'meta_description': 'Explore the greatest movie directors who revolutionized cinema. From Hitchcock to Spielberg, discover filmmakers who changed how we see movies.',
-        'date': '2024-11-04',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Visionary Directors Who Transformed Cinema',
-                'text': 'Great directors are artists who use cinema\'s unique properties - editing, cinematography, sound, performance - to create experiences impossible in any other medium. They develop distinctive styles and thematic preoccupations that make their films immediately recognizable while pushing the boundaries of what movies can achieve.'
-            }
-        ]
-    },
-    'movie-cinematography-best': {
-        'title': 'Best Movie Cinematography - Visual Masterpieces in Film',
-        'meta_description': 'Celebrate the best movie cinematography that created visual poetry on screen. From Blade Runner to Lawrence of Arabia, explore films as visual art.',
-        'date': '2024-11-02',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Art of Visual Storytelling Through Camera and Light',
-                'text': 'Cinematography transforms written words into visual poetry, using composition, lighting, color, and camera movement to convey emotion, establish mood, and guide audience attention. Great cinematographers collaborate with directors to create visual languages that support and enhance narrative while creating images beautiful enough to stand alone as art.'
-            }
-        ]
-    },
-    'movie-plot-twists-best': {
-        'title': 'Best Movie Plot Twists That Shocked Audiences',
-        'meta_description': 'Discover the best movie plot twists that redefined storytelling. From The Sixth Sense to Fight Club, explore shocking reveals that changed everything.',
-        'date': '2024-10-30',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Art of the Perfect Plot Twist',
-                'text': 'Great plot twists recontextualize everything that came before, forcing audiences to reconsider characters, motivations, and events in entirely new light. The best twists are both surprising and inevitable, feeling shocking in the moment while making perfect sense upon reflection.'
-            }
-        ]
-    },
-    'movie-cult-classics': {
-        'title': 'Best Cult Classic Movies That Found Their Audience Over Time',
-        'meta_description': 'Explore the best cult classic movies that gained devoted followings. From The Rocky Horror Picture Show to The Big Lebowski, discover films that became legends.',
-        'date': '2024-10-28',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'How Movies Become Cult Classics Through Passionate Fandoms',
-                'text': 'Cult classic movies often failed commercially upon initial release but discovered devoted audiences through home video, late-night television, or word-of-mouth recommendations. These films offer unique perspectives, memorable characters, and quotable dialogue that create communities around shared appreciation for misunderstood or overlooked cinema.'
-            }
-        ]
-    },
-    'best-amazon-prime-movies': {
-        'title': 'Best Amazon Prime Movies 2025 - Must-Watch Films on Prime Video',
-        'meta_description': 'Discover the best movies on Amazon Prime Video in 2025. From award-winning originals to classic films, explore top-rated content available for Prime members.',
-        'date': '2025-01-20',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'Why Amazon Prime Video Is Essential for Movie Lovers in 2025',
-                'text': 'Amazon Prime Video has emerged as a powerhouse streaming service, offering an impressive library of over 20,000 movies and TV shows included with Prime membership. The platform has invested heavily in original content, producing critically acclaimed films like "The Marvelous Mrs. Maisel" movie adaptation and exclusive theatrical releases from major studios. Prime Video\'s partnership with MGM Studios has expanded its classic film collection, bringing timeless cinema to modern audiences. The service offers unique features like X-Ray for behind-the-scenes information and the ability to rent or buy new releases not included in the subscription. With 4K Ultra HD streaming, Dolby Atmos sound, and offline downloads, Prime Video delivers premium viewing experiences. The platform excels in international content, showcasing Bollywood blockbusters, European arthouse cinema, and Asian action films. Amazon\'s commitment to diverse storytelling ensures that every viewer finds compelling content across all genres and cultures.'
-            },
-            {
-                'heading': 'Top 10 Amazon Prime Original Movies You Cannot Miss',
-                'text': 'Amazon Prime Originals have garnered critical acclaim and numerous awards, establishing the platform as a serious competitor in original film production. "The Sound of Metal" earned Oscar nominations for its powerful portrayal of a drummer losing his hearing, featuring Riz Ahmed\'s transformative performance. "One Night in Miami" showcases Regina King\'s exceptional directorial debut, imagining a conversation between Malcolm X, Muhammad Ali, Jim Brown, and Sam Cooke. "Coming 2 America" brought Eddie Murphy back to his iconic role after 30 years, delivering nostalgia and fresh comedy. "The Tomorrow War" offers big-budget sci-fi action with Chris Pratt fighting aliens across time. "Borat Subsequent Moviefilm" captured cultural zeitgeist during pandemic times with Sacha Baron Cohen\'s fearless satire. "The Vast of Night" delivers atmospheric sci-fi mystery on a modest budget. "Troop Zero" presents a heartwarming story about misfits finding belonging. These originals demonstrate Amazon\'s commitment to diverse storytelling, supporting both established filmmakers and emerging voices with substantial budgets and creative freedom.'
-            },
-            {
-                'heading': 'Classic Movies and Hidden Gems on Amazon Prime Video',
-                'text': 'Beyond original content, Prime Video houses an exceptional collection of classic cinema and overlooked masterpieces. The MGM library brings Golden Age Hollywood films including "Singin\' in the Rain," "Lawrence of Arabia," and "Some Like It Hot." Film noir enthusiasts can explore "The Third Man," "Double Indemnity," and "The Maltese Falcon." International cinema is well-represented with works from Akira Kurosawa, Federico Fellini, and Ingmar Bergman. Hidden gems include "The Vast of Night," a low-budget sci-fi thriller with stunning cinematography and suspenseful storytelling. "Sound of Metal" offers a unique perspective on disability and identity. "Honey Boy" presents Shia LaBeouf\'s autobiographical screenplay about childhood trauma. "The Report" delivers a gripping political thriller about the CIA torture program. "American Animals" blends documentary and narrative filmmaking in a heist story. "You Were Never Really Here" showcases Joaquin Phoenix in a dark psychological thriller. These films demonstrate that Prime Video offers depth beyond mainstream blockbusters, providing cinephiles with substantial artistic content.'
-            },
-            {
-                'heading': 'How to Maximize Your Amazon Prime Video Experience',
-                'text': 'To get the most from Prime Video, create separate profiles for family members to receive personalized recommendations. Use the Watchlist feature to save interesting titles for later viewing. Enable X-Ray during playback to see cast information, music details, and trivia without leaving the film. Download content for offline viewing when traveling or in areas with limited connectivity. Adjust streaming quality in settings to balance between video quality and data usage. Explore IMDb integration for detailed information about films, including user reviews and professional critic scores. Use voice commands with Alexa-enabled devices for hands-free control. Take advantage of Prime Video Channels to add subscriptions like Showtime, Starz, or specialized services like Mubi for arthouse cinema. Check the "Leaving Soon" section to prioritize films that will be removed from the service. Use FreeMovieSearcher\'s recommendation engine to discover personalized suggestions based on your viewing history. Rate movies after watching to improve recommendation accuracy. Participate in Prime Video\'s watch parties feature to enjoy films with friends and family remotely.'
-            }
-        ]
-    },
-    'best-mystery-movies': {
-        'title': 'Best Mystery Movies That Keep You Guessing Until the End',
-        'meta_description': 'Explore the best mystery movies filled with twists, clues, and unforgettable reveals. From classic whodunits to modern psychological thrillers.',
-        'date': '2025-01-18',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Enduring Appeal of Mystery Films in Cinema',
-                'text': 'Mystery movies captivate audiences by transforming viewers into active participants, challenging them to piece together clues, identify suspects, and solve puzzles alongside detectives. The best mystery films balance providing enough information for engaged viewers to theorize while maintaining surprising revelations that feel both shocking and inevitable upon reflection. These films tap into fundamental human curiosity and the satisfaction of uncovering hidden truths. Classic mystery structure follows detective narratives where methodical investigation reveals carefully concealed secrets, while modern psychological mysteries blur lines between reality and perception. The genre has evolved from straightforward whodunits to complex narratives exploring unreliable narrators, fractured timelines, and moral ambiguity. Mystery films create immersive experiences through atmospheric cinematography, meticulous production design establishing time and place, and carefully calibrated pacing that builds suspense. The satisfaction comes not just from the reveal but from the journey of discovery, making mystery films infinitely rewatchable as viewers notice previously overlooked clues.'
-            },
-            {
-                'heading': 'Classic Mystery Masterpieces That Defined the Genre',
-                'text': 'Agatha Christie adaptations set the gold standard for mystery cinema with "Murder on the Orient Express" presenting an ensemble cast of suspects in a confined setting where everyone has secrets and motives. Sidney Lumet\'s 1974 version features impeccable performances from Albert Finney as Hercule Poirot and an all-star cast. The film demonstrates how methodical investigation and deductive reasoning can unravel seemingly impossible crimes. "Chinatown" transcends traditional mystery with Roman Polanski\'s neo-noir exploring corruption, conspiracy, and moral decay in 1930s Los Angeles. Jack Nicholson\'s private detective Jake Gittes uncovers layers of deception that lead to devastating personal and political revelations. "The Maltese Falcon" established detective noir aesthetics with Humphrey Bogart\'s Sam Spade navigating a world of lies, betrayal, and greed. "Rear Window" demonstrates Hitchcock\'s mastery of suspense as James Stewart\'s wheelchair-bound photographer suspects his neighbor of murder based on observations from his apartment window. These classics establish mystery conventions while demonstrating that great mystery films transcend genre formulas to explore human nature, social structures, and moral complexity.'
-            },
-            {
-                'heading': 'Modern Mystery Films That Redefined Expectations',
-                'text': 'Contemporary mystery cinema has evolved beyond traditional detective narratives to embrace psychological complexity and narrative experimentation. "Gone Girl" subverts expectations by making the mystery not just about a disappearance but about marriage, media manipulation, and the masks people wear. David Fincher\'s meticulous direction and Gillian Flynn\'s sharp screenplay create a twisted puzzle where every revelation changes perception. "Knives Out" revitalizes the classic whodunit format with Rian Johnson\'s clever screenplay featuring Daniel Craig\'s eccentric detective Benoit Blanc investigating a wealthy family after the patriarch\'s suspicious death. The film balances humor, social commentary, and genuine mystery with a surprising structure that reveals the killer midway then shifts focus to how the detective uncovers the truth. "Prisoners" delivers a dark, intense mystery about a father\'s desperate search for his kidnapped daughter, exploring how far good people will go when faced with unthinkable circumstances. "Zodiac" presents a procedural mystery that refuses easy answers, reflecting the frustrating reality of unsolved crimes. "Shutter Island" layers psychological complexity with unreliable narration and twist revelations. These modern mysteries demonstrate the genre\'s continued evolution and relevance.'
-            },
-            {
-                'heading': 'Essential Elements of Great Mystery Storytelling',
-                'text': 'Successful mystery films require careful construction where every element serves the puzzle while maintaining emotional engagement. Clues must be planted fairly without becoming obvious, allowing attentive viewers to theorize while ensuring revelations still surprise. Red herrings distract without feeling cheap or manipulative. Character development ensures audiences care about outcomes beyond intellectual curiosity about the solution. Suspects need distinct personalities, plausible motives, and opportunities that make multiple solutions seem viable. Atmosphere and setting become characters themselves, establishing mood and providing subtext – fog-shrouded Gothic mansions, rain-soaked urban landscapes, or claustrophobic confined spaces heighten tension and mystery. Pacing balances investigation scenes that reveal information with action or character moments that maintain narrative momentum. The detective or protagonist must be compelling enough to carry the investigation, whether they\'re brilliant observers like Sherlock Holmes or ordinary people thrust into extraordinary circumstances. The best mystery films ensure that the emotional payoff matches the intellectual satisfaction of the revealed truth, making the mystery resolution feel meaningful beyond mere puzzle-solving. Multiple viewings reveal careful craftsmanship in how information was presented and misdirection achieved.'
-            }
-        ]
-    },
-    'best-plot-twist-movies': {
-        'title': 'Best Plot Twist Movies - Shocking Reveals That Changed Everything',
-        'meta_description': 'Experience the best plot twist movies that left audiences stunned. From The Sixth Sense to Fight Club, discover films with unforgettable surprise endings.',
-        'date': '2025-01-16',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Art and Psychology of Effective Plot Twists',
-                'text': 'Great plot twists recontextualize everything that came before, forcing audiences to reconsider characters, motivations, and events in entirely new light while feeling both surprising and inevitable upon reflection. The best twists are carefully constructed from the beginning, with filmmakers planting clues that seem innocuous during first viewing but become obvious in retrospect. This requires meticulous planning where every scene, line of dialogue, and visual detail serves dual purposes – supporting both the perceived narrative and the hidden truth. Psychological research shows that effective twists trigger cognitive dissonance as our brains reconcile new information with established beliefs, creating memorable emotional responses. The shock comes from subverted expectations built through narrative misdirection, unreliable narrators, or strategic information withholding. However, twists must be earned through internal logic rather than arbitrary reveals that feel cheap or manipulative. The most satisfying twists make audiences want to immediately rewatch the film to spot missed clues and appreciate the filmmakers\' craftsmanship. They demonstrate that cinema can manipulate perception and challenge assumptions about storytelling itself.'
-            },
-            {
-                'heading': 'The Sixth Sense - The Twist That Defined a Generation',
-                'text': 'M. Night Shyamalan\'s 1999 masterpiece set the gold standard for plot twist cinema with its revelation that child psychologist Malcolm Crowe, played by Bruce Willis, has been dead throughout the film. The twist works because Shyamalan meticulously constructs every scene to support both interpretations – Malcolm is helping Haley Joel Osment\'s Cole Sear with his ability to see dead people while simultaneously being one of those spirits without realizing it. Visual clues planted throughout include Malcolm wearing the same clothes after the opening shooting, his estranged relationship with his wife that audiences misinterpret as marital problems rather than her inability to see him, and the color red appearing whenever the supernatural is present. The twist reframes the entire narrative from a story about helping a troubled child to a ghost story about Malcolm accepting his own death and finding redemption through helping Cole. The emotional impact comes from understanding that Malcolm\'s journey was about spiritual unfinished business and acceptance rather than professional achievement. Audiences immediately wanted to rewatch the film to catch the carefully hidden clues, sparking discussions about filmmaking craft and narrative misdirection that influenced countless future movies.'
-            },
-            {
-                'heading': 'Fight Club - Identity, Reality, and Unreliable Narration',
-                'text': 'David Fincher\'s adaptation of Chuck Palahniuk\'s novel delivers one of cinema\'s most famous twists – Tyler Durden, the charismatic anarchist played by Brad Pitt, is actually a dissociative identity created by the unnamed narrator portrayed by Edward Norton. The revelation recontextualizes every scene featuring Tyler, showing that the narrator was alone during those moments, with Tyler representing his suppressed desires for freedom, masculinity, and rebellion against consumer culture. Fincher plants visual clues throughout: Tyler appearing for single frames before the characters officially meet, scenes where other characters only acknowledge the narrator rather than Tyler, and architectural impossibilities in Tyler\'s house. The twist comments on masculinity, capitalism, mental health, and identity while functioning as pure narrative shock. It works because Tyler embodies everything the narrator believes he lacks but actually possesses within himself. The film explores how we create personas to cope with societal pressures and existential dissatisfaction. Upon rewatching, every Tyler scene reveals the narrator\'s psychological state and internal conflict. The twist elevated Fight Club from cult hit to cultural phenomenon, demonstrating how surprise reveals can enhance thematic depth rather than existing merely for shock value.'
-            },
-            {
-                'heading': 'Other Unforgettable Plot Twist Masterpieces',
-                'text': 'Plot twist cinema extends far beyond these iconic examples, with numerous films delivering shocking reveals that redefine their narratives. "The Usual Suspects" concludes with the revelation that Verbal Kint, seemingly weak and helpless, is actually the legendary criminal mastermind Keyser Söze, with Roger "Verbal" Kint fabricating the entire story from objects in the police office. "Arrival" transforms a first-contact alien narrative into exploration of time, language, and predestination as Amy Adams\' linguist realizes her visions aren\'t memories but premonitions. "Shutter Island" reveals that Leonardo DiCaprio\'s federal marshal is actually an institutionalized patient, with the investigation being elaborate role-play therapy. "The Others" inverts the haunted house formula by revealing Nicole Kidman\'s family are the ghosts haunting the living. "Oldboy" delivers a gut-punch twist about revenge and hypnotic manipulation that makes audiences question revenge narratives. "Memento" uses reverse chronology to reveal the protagonist has been manipulating his own limited memory to maintain purpose. "The Prestige" features multiple twists about identity, sacrifice, and the cost of obsession. These films demonstrate that effective twists serve thematic purposes beyond mere surprise, using unexpected revelations to explore deeper truths about human nature, perception, and the stories we tell ourselves.'
-            }
-        ]
-    },
-    'best-superhero-movies': {
-        'title': 'Best Superhero Movies - From Marvel to DC and Beyond',
-        'meta_description': 'Discover the best superhero movies that defined the genre. From The Dark Knight to Avengers Endgame, explore the greatest comic book films ever made.',
-        'date': '2025-01-14',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Evolution of Superhero Cinema Into Dominant Film Genre',
-                'text': 'Superhero movies have evolved from campy serials and niche comic adaptations into the dominant force in global cinema, generating billions in revenue and shaping pop culture discourse. This transformation began with Richard Donner\'s "Superman" (1978) proving that comic book characters could carry serious dramatic weight and emotional depth. Tim Burton\'s "Batman" (1989) established darker tones and psychological complexity. The modern era exploded with Sam Raimi\'s "Spider-Man" (2002) demonstrating mass audience appeal, followed by Christopher Nolan\'s "Dark Knight" trilogy elevating the genre to prestige cinema. The Marvel Cinematic Universe revolutionized filmmaking with interconnected storytelling across multiple films and characters, creating unprecedented shared universe narratives. Superhero films now explore complex themes including power and responsibility, vigilantism and justice, identity and belonging, sacrifice and heroism, discrimination and acceptance. The genre encompasses multiple styles from gritty realism to cosmic fantasy, political thrillers to coming-of-age stories. Modern superhero cinema reflects contemporary anxieties about authority, surveillance, environmental collapse, and social division while providing escapist entertainment and aspirational heroes.'
-            },
-            {
-                'heading': 'The Dark Knight - Superhero Cinema as Serious Art',
-                'text': 'Christopher Nolan\'s 2008 masterpiece transcended the superhero genre to become one of the greatest films of the 21st century, proving that comic book movies could deliver profound thematic depth, moral complexity, and artistic excellence rivaling any prestige drama. Heath Ledger\'s Oscar-winning performance as the Joker created one of cinema\'s most terrifying villains – an agent of chaos who exposes the fragility of social order and the thin line between heroism and vigilantism. Christian Bale\'s Batman faces impossible moral choices as Gotham descends into anarchy, forcing him to compromise principles to save the city. The film explores surveillance ethics, the social contract, charismatic evil, and whether ends justify means in fighting terrorism. Wally Pfister\'s cinematography captures Gotham as a realized urban landscape rather than stylized fantasy, while Hans Zimmer\'s score builds relentless tension. The interrogation scene between Batman and Joker represents peak dramatic filmmaking regardless of genre. Two-Face\'s transformation from idealistic district attorney to vengeful villain demonstrates how trauma corrupts noble intentions. The film\'s ending, with Batman accepting blame for Harvey Dent\'s crimes to preserve hope, delivers genuine tragic weight rarely seen in blockbuster entertainment.'
-            },
-            {
-                'heading': 'Marvel Cinematic Universe - The Infinity Saga Achievement',
-                'text': 'The MCU\'s 23-film Infinity Saga represents unprecedented achievement in serialized cinematic storytelling, weaving interconnected narratives across a decade into satisfying culmination with "Avengers: Endgame." Marvel Studios mastered balancing standalone stories with overarching mythology, introducing characters in solo films before uniting them in team-up spectacles. "Iron Man" established the template with Robert Downey Jr.\'s charismatic Tony Stark – flawed, witty, and human despite technological powers. "Captain America: The Winter Soldier" delivered a political thriller about surveillance and freedom disguised as superhero action. "Black Panther" explored African futurism, colonialism, and identity while celebrating Black culture and becoming a cultural phenomenon. "Thor: Ragnarok" reinvented its franchise with humor and visual creativity. "Guardians of the Galaxy" proved audiences would embrace obscure characters with the right tone and heart. "Avengers: Infinity War" shocked audiences with heroes failing and villain Thanos winning, setting up "Endgame\'s" emotional payoff where original Avengers sacrifice everything to restore the universe. The Infinity Saga succeeded through compelling characters, thematic consistency about power and responsibility, and emotional investment built over years, making the conclusion genuinely moving despite its massive scale.'
-            },
-            {
-                'heading': 'Essential Superhero Films Beyond Marvel and DC',
-                'text': 'Great superhero cinema extends beyond the big two comic publishers, with films that deconstruct, subvert, or reimagine the genre in innovative ways. "The Incredibles" delivers Pixar\'s sophisticated examination of superhero retirement, family dynamics, and the ethics of exceptional individuals in egalitarian society, functioning as both fantastic entertainment and sharp social commentary. "Unbreakable" presents M. Night Shyamalan\'s grounded take on superhero origin stories, exploring destiny, purpose, and the symbiotic relationship between hero and villain. "Kick-Ass" offers violent satire of superhero culture through ordinary people adopting vigilante personas without actual powers, examining hero worship and real-world consequences of violence. "Chronicle" reimagines the origin story as found-footage character study of troubled teens gaining telekinetic powers, exploring how trauma and power corrupt. "Logan" delivers a Western-influenced character piece about aging, legacy, and mortality, giving Wolverine a proper dramatic sendoff. "Spider-Man: Into the Spider-Verse" revolutionizes superhero animation with stunning visual innovation and heartfelt story about multiple Spider-people across dimensions. "Watchmen" deconstructs superhero mythology entirely, examining the psychological profiles of costumed vigilantes and questioning whether such individuals would actually be heroic. These films demonstrate that superhero concepts can support any story genre and thematic exploration.'
-            }
-        ]
-    },
-    'best-crime-movies': {
-        'title': 'Best Crime Movies - Gangsters, Heists, and Noir Classics',
-        'meta_description': 'Explore the best crime movies from The Godfather to Goodfellas. Discover gripping tales of gangsters, heists, detectives, and the criminal underworld.',
-        'date': '2025-01-12',
-        'author': 'FreeMovieSearcher Editorial',
-        'content': [
-            {
-                'heading': 'The Enduring Appeal of Crime Cinema Across Generations',
-                'text': 'Crime movies captivate audiences by exploring humanity\'s darkest impulses, moral ambiguity, and the allure of forbidden transgression within societies bound by rules and consequences. The genre offers vicarious thrills of living outside social constraints while examining the psychological and social factors that drive criminal behavior. Great crime films balance glorification with condemnation, presenting criminals as complex characters with relatable motivations rather than simple villains. They explore themes of loyalty and betrayal, power and corruption, justice and revenge, ambition and downfall. The best crime cinema serves as social commentary, reflecting anxieties about class disparity, institutional failure, urban decay, and the American Dream\'s dark underbelly. Film noir established visual and thematic conventions – shadowy cinematography, morally compromised protagonists, femme fatales, and pessimistic worldviews – that continue influencing modern films. Crime narratives span multiple subgenres including gangster epics, heist thrillers, police procedurals, noir mysteries, and true crime adaptations. The genre provides frameworks for examining how circumstances, choices, and social structures shape human behavior and destiny.'
-            },
-            {
-                'heading': 'The Godfather - The Pinnacle of Crime Cinema',
-                'text': 'Francis Ford Coppola\'s 1972 masterpiece remains not just the greatest crime film but one of the finest achievements in cinema history, transforming Mario Puzo\'s pulp novel into operatic exploration of family, power, and the corruption of the American Dream. Marlon Brando\'s iconic Don Vito Corleone embodies Old World values of honor and loyalty transplanted to capitalist America where business and violence intertwine. Al Pacino\'s Michael Corleone undergoes cinema\'s greatest character transformation from war hero reluctant to join the family business to cold, calculating mafia boss who consolidates power through strategic violence. The film\'s genius lies in making audiences complicit in the Corleones\' crimes through emotional investment in the family\'s survival and success. Gordon Willis\'s shadowy cinematography creates a visual language where characters literally operate in moral darkness. Nino Rota\'s haunting score mixes romantic nostalgia with ominous foreboding. The film balances intimate family moments – the wedding sequence establishing characters and relationships – with shocking violence like the horse head scene and restaurant shooting. Its examination of immigrant assimilation, corporate criminality, and American institutions\' corruption resonates decades later.'
-            },
-            {
-                'heading': 'Heist Films - The Perfect Crime and Inevitable Failure',
-                'text': 'Heist movies deliver unique satisfaction through meticulous planning, specialized expertise, and the fantasy of pulling off impossible thefts against overwhelming odds. "Heat" represents Michael Mann\'s masterpiece where professional thief Neil McCauley (Robert De Niro) and detective Vincent Hanna (Al Pacino) recognize themselves as mirror images – both obsessive men sacrificing personal relationships for professional excellence. The legendary coffee shop conversation between them acknowledges mutual respect despite opposing sides of the law. The downtown Los Angeles shootout remains one of cinema\'s most intense action sequences with realistic sound design and tactical precision. "Ocean\'s Eleven" delivers stylish fun through Steven Soderbergh\'s slick direction, charismatic ensemble cast led by George Clooney, and the satisfaction of watching competent professionals execute elaborate plans. "The Italian Job" (both 1969 original and 2003 remake) offers European flair and iconic Mini Cooper chases. "Rififi" presents the template for heist films with its wordless 30-minute robbery sequence emphasizing technique and tension. "Logan Lucky" subverts expectations with working-class criminals pulling off a NASCAR heist. These films combine puzzle-solving satisfaction, star power, exotic locations, and vicarious thrills of outsmarting authority.'
-            },
-            {
-                'heading': 'Modern Crime Classics Redefining the Genre',
-                'text': 'Contemporary crime cinema continues evolving by subverting conventions, exploring new perspectives, and reflecting changing social realities. "No Country for Old Men" delivers the Coen Brothers\' bleak meditation on fate, violence, and the incomprehensibility of evil through Javier Bardem\'s terrifying Anton Chigurh – a remorseless killer who operates by arbitrary rules in a morally chaotic universe. "Sicario" examines the drug war\'s moral complexity through Emily Blunt\'s idealistic FBI agent confronting the brutal realities of border violence and extrajudicial justice. Denis Villeneuve\'s direction creates overwhelming dread through Roger Deakins\' cinematography and Jóhann Jóhannsson\'s oppressive score. "Drive" reinvents the getaway driver archetype with Ryan Gosling\'s silent stuntman drawn into criminal violence while trying to protect his neighbors. Nicolas Winding Refn\'s stylized visuals and Cliff Martinez\'s synth score create hypnotic atmosphere. "Hell or High Water" offers a modern Western about brothers robbing banks to save their family ranch, exploring economic desperation and institutional failure. "Parasite" uses crime elements to examine class warfare and social inequality in contemporary South Korea. These films demonstrate that crime cinema remains vital for exploring contemporary anxieties, social injustice, and moral complexity in an uncertain world.'
-            }
-        ]
-    }
-}
+# Blog content database with high-quality SEO-optimized content, kept in
+# blog_posts.json (slug -> post) and parsed once at startup
+try:
+    with open('blog_posts.json', 'rb') as f:
+        BLOG_POSTS = orjson.loads(f.read())
+    print("Blog posts loaded successfully!")
+except FileNotFoundError:
+    print("Error: blog_posts.json not found.")
+    BLOG_POSTS = {}
+
+# Blog pages are the same for every visitor, so each post is rendered once at
+# startup and also kept gzip-compressed for clients that accept it. ETags are
+# computed here too, so neither the page nor its hash is redone per request.
+BLOG_HTML = {}
+BLOG_HTML_GZIP = {}
+BLOG_ETAGS = {}
+BLOG_ETAGS_GZIP = {}
+with app.test_request_context():
+    for slug, post in BLOG_POSTS.items():
+        html = render_template('blog_post.html', 
+                               post=post, 
+                               slug=slug,
+                               canonical_url=f'https://freemoviesearcher.tech/blog/{slug}')
+        body = html.encode('utf-8')
+        BLOG_HTML[slug] = body
+        BLOG_HTML_GZIP[slug] = gzip.compress(body, compresslevel=9, mtime=0)
+        BLOG_ETAGS[slug] = generate_etag(body)
+        BLOG_ETAGS_GZIP[slug] = generate_etag(BLOG_HTML_GZIP[slug])
 
 @app.route('/blog/<slug>')
 def blog_post(slug):
     """Render individual blog post with SEO optimization"""
-    post = BLOG_POSTS.get(slug)
-    
-    if not post:
+    if slug not in BLOG_HTML:
         abort(404)
     
-    return render_template('blog_post.html', 
-                         post=post, 
-                         slug=slug,
-                         canonical_url=f'https://freemoviesearcher.tech/blog/{slug}')
+    if request.accept_encodings['gzip']:
+        response = make_response(BLOG_HTML_GZIP[slug])
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(BLOG_ETAGS_GZIP[slug])
+    else:
+        response = make_response(BLOG_HTML[slug])
+        response.set_etag(BLOG_ETAGS[slug])
+    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    return response
 
 @app.route('/autocomplete', methods=['GET'])
 def autocomplete():
@@ -1086,14 +598,10 @@ def autocomplete():
     
     try:
         # Get movies that start with the query
-        starts_with = data[data['Title'].str.startswith(query, na=False)]
-        
-        # Limit results
-        if len(starts_with) > limit:
-            starts_with = starts_with.head(limit)
+        starts_with = prefix_rows(query)[:limit]
         
         # Return only titles for autocomplete
-        suggestions = starts_with['Title'].str.title().tolist()
+        suggestions = TITLES_DISPLAY[starts_with].tolist()
         return jsonify(suggestions)
     except Exception as e:
         print(f"Error in autocomplete: {e}")
@@ -1106,15 +614,19 @@ def recommend():
         return jsonify({'error': 'No movie title provided!'}), 400
 
     title = title.strip()
+    if len(title) > MAX_TITLE_QUERY_LEN:
+        return jsonify({'error': 'Movie title is too long!'}), 400
+
     results = recommendations(title)
-    if results is None or results.empty:
+    if not results:
         return jsonify({'error': f"Movie '{title}' not found. Please check the spelling or try searching for it first."})
 
     # Debugging: Log the recommendations being returned
     print(f"Returning {len(results)} recommendations for '{title}'")
-    return jsonify(results.to_dict(orient='records'))
+    return movies_response(results)
 
 @app.route('/search', methods=['GET'])
+@cache.cached(timeout=60, query_string=True)
 def search():
     query = request.args.get('query')
     limit = request.args.get('limit', 20, type=int)
@@ -1123,37 +635,40 @@ def search():
         return jsonify({'error': 'No search query provided!'}), 400
     
     results = search_movies(query, limit)
-    if results is None or results.empty:
+    if not results:
         return jsonify({'error': f"No movies found matching '{query}'."})
     
-    return jsonify(results.to_dict(orient='records'))
+    return movies_response(results)
 
 @app.route('/popular', methods=['GET'])
 def popular():
     limit = request.args.get('limit', 20, type=int)
     results = get_popular_movies(limit)
     
-    if results is None or results.empty:
+    if not results:
         return jsonify({'error': 'Unable to fetch popular movies.'})
     
-    return jsonify(results.to_dict(orient='records'))
+    return movies_response(results, stream=True)
 
 @app.route('/genres', methods=['GET'])
+@cache.cached(timeout=300)
 def genres():
     genre_list = get_genres()
     return jsonify(genre_list)
 
 @app.route('/genre/<genre_name>', methods=['GET'])
+@cache.cached(timeout=60, query_string=True)
 def movies_by_genre(genre_name):
     limit = request.args.get('limit', 20, type=int)
     results = get_movies_by_genre(genre_name, limit)
     
-    if results is None or results.empty:
+    if not results:
         return jsonify({'error': f"No movies found for genre '{genre_name}'."})
     
-    return jsonify(results.to_dict(orient='records'))
+    return movies_response(results)
 
 @app.route('/stats', methods=['GET'])
+@cache.cached(timeout=300)
 def get_stats():
     try:
         if data is None:
@@ -1166,7 +681,7 @@ def get_stats():
             'movies_per_decade': get_movies_per_decade(),
             'top_directors': get_top_directors(10),
             'dataset_info': {
-                'columns': list(data.columns),
+                'columns': DATASET_FILE_COLUMNS,
                 'sample_size': min(len(data), 1000)
             }
         }
@@ -1179,14 +694,7 @@ def get_stats():
 # Helper functions for statistics
 def get_top_genres(limit=5):
     try:
-        genre_counts = {}
-        for genres_str in data['genres'].dropna():
-            if isinstance(genres_str, str):
-                genres = [g.strip() for g in genres_str.split(',')]
-                for genre in genres:
-                    genre_counts[genre] = genre_counts.get(genre, 0) + 1
-        
-        return sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return GENRE_COUNTS[:limit]
     except:
         return []
 
@@ -1205,73 +713,72 @@ def get_movies_per_decade():
 
 def get_top_directors(limit=10):
     try:
-        director_counts = data['Director'].value_counts().head(limit)
-        return [(director, count) for director, count in director_counts.items()]
+        return DIRECTOR_COUNTS[:limit]
     except:
         return []
 
 # SEO Routes - Sitemap and Robots.txt
+# Main pages with optimized priorities and changefreq. The homepage is added
+# per request because its lastmod follows the current date.
+SITEMAP_PAGES = [
+    {'loc': '/about', 'priority': '0.9', 'changefreq': 'monthly', 'lastmod': datetime(2025, 12, 1)},
+    {'loc': '/faq', 'priority': '0.9', 'changefreq': 'weekly', 'lastmod': datetime(2025, 12, 1)},
+    {'loc': '/contact', 'priority': '0.7', 'changefreq': 'monthly', 'lastmod': datetime(2025, 12, 1)},
+    {'loc': '/privacy', 'priority': '0.5', 'changefreq': 'yearly', 'lastmod': datetime(2025, 11, 15)},
+    {'loc': '/terms', 'priority': '0.5', 'changefreq': 'yearly', 'lastmod': datetime(2025, 11, 15)},
+    {'loc': '/disclaimer', 'priority': '0.5', 'changefreq': 'yearly', 'lastmod': datetime(2025, 11, 15)},
+]
+
+# Add all blog posts with metadata
+BLOG_DATES = {
+    'best-netflix-movies-2025': datetime(2025, 1, 15),
+    'top-10-movies-all-time': datetime(2025, 1, 10),
+    'best-action-movies': datetime(2025, 1, 8),
+    'best-amazon-prime-movies': datetime(2025, 1, 20),
+    'best-mystery-movies': datetime(2025, 1, 18),
+    'best-plot-twist-movies': datetime(2025, 1, 16),
+    'best-superhero-movies': datetime(2025, 1, 14),
+    'best-crime-movies': datetime(2025, 1, 12),
+}
+
+for slug in BLOG_POSTS.keys():
+    SITEMAP_PAGES.append({
+        'loc': f'/blog/{slug}',
+        'priority': '0.8',
+        'changefreq': 'monthly',
+        'lastmod': BLOG_DATES.get(slug, datetime(2024, 11, 1))
+    })
+
+# One <url> entry of the sitemap
+def sitemap_url(page):
+    return (
+        '  <url>\n'
+        f'    <loc>https://freemoviesearcher.tech{page["loc"]}</loc>\n'
+        f'    <lastmod>{page["lastmod"].strftime("%Y-%m-%d")}</lastmod>\n'
+        f'    <changefreq>{page["changefreq"]}</changefreq>\n'
+        f'    <priority>{page["priority"]}</priority>\n'
+        '  </url>\n'
+    )
+
+# Generate XML with enhanced schema once; only the homepage entry varies
+SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"\n'
+    '        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1"\n'
+    '        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">\n'
+)
+SITEMAP_FOOTER = ''.join(sitemap_url(page) for page in SITEMAP_PAGES) + '</urlset>'
+
 @app.route('/sitemap.xml')
 def sitemap():
     """Generate enhanced dynamic sitemap with images and priorities"""
-    from datetime import datetime
-    
-    # Main pages with optimized priorities and changefreq
-    pages = [
-        {'loc': '/', 'priority': '1.0', 'changefreq': 'daily', 'lastmod': datetime.now()},
-        {'loc': '/about', 'priority': '0.9', 'changefreq': 'monthly', 'lastmod': datetime(2025, 12, 1)},
-        {'loc': '/faq', 'priority': '0.9', 'changefreq': 'weekly', 'lastmod': datetime(2025, 12, 1)},
-        {'loc': '/contact', 'priority': '0.7', 'changefreq': 'monthly', 'lastmod': datetime(2025, 12, 1)},
-        {'loc': '/privacy', 'priority': '0.5', 'changefreq': 'yearly', 'lastmod': datetime(2025, 11, 15)},
-        {'loc': '/terms', 'priority': '0.5', 'changefreq': 'yearly', 'lastmod': datetime(2025, 11, 15)},
-        {'loc': '/disclaimer', 'priority': '0.5', 'changefreq': 'yearly', 'lastmod': datetime(2025, 11, 15)},
-    ]
-    
-    # Add all blog posts with metadata
-    blog_dates = {
-        'best-netflix-movies-2025': datetime(2025, 1, 15),
-        'top-10-movies-all-time': datetime(2025, 1, 10),
-        'best-action-movies': datetime(2025, 1, 8),
-        'best-amazon-prime-movies': datetime(2025, 1, 20),
-        'best-mystery-movies': datetime(2025, 1, 18),
-        'best-plot-twist-movies': datetime(2025, 1, 16),
-        'best-superhero-movies': datetime(2025, 1, 14),
-        'best-crime-movies': datetime(2025, 1, 12),
-    }
-    
-    for slug in BLOG_POSTS.keys():
-        pages.append({
-            'loc': f'/blog/{slug}',
-            'priority': '0.8',
-            'changefreq': 'monthly',
-            'lastmod': blog_dates.get(slug, datetime(2024, 11, 1))
-        })
-    
-    # Generate XML with enhanced schema
-    sitemap_xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    sitemap_xml += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"\n'
-    sitemap_xml += '        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1"\n'
-    sitemap_xml += '        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">\n'
-    
-    for page in pages:
-        sitemap_xml += '  <url>\n'
-        sitemap_xml += f'    <loc>https://freemoviesearcher.tech{page["loc"]}</loc>\n'
-        sitemap_xml += f'    <lastmod>{page["lastmod"].strftime("%Y-%m-%d")}</lastmod>\n'
-        sitemap_xml += f'    <changefreq>{page["changefreq"]}</changefreq>\n'
-        sitemap_xml += f'    <priority>{page["priority"]}</priority>\n'
-        sitemap_xml += '  </url>\n'
-    
-    sitemap_xml += '</urlset>'
-    
-    response = make_response(sitemap_xml)
+    home = sitemap_url({'loc': '/', 'priority': '1.0', 'changefreq': 'daily', 'lastmod': datetime.now()})
+    response = make_response(SITEMAP_HEADER + home + SITEMAP_FOOTER)
     response.headers['Content-Type'] = 'application/xml; charset=utf-8'
     response.headers['Cache-Control'] = 'public, max-age=86400'
     return response
 
-@app.route('/robots.txt')
-def robots():
-    """Serve optimized robots.txt for search engine crawlers"""
-    robots_txt = """# Robots.txt for Free Movie Searcher
+ROBOTS_TXT = """# Robots.txt for Free Movie Searcher
 # Optimized for Google, Bing, DuckDuckGo, Yandex crawlers
 # Last updated: 2025-12-03
 
@@ -1329,8 +836,11 @@ Disallow: /
 User-agent: DotBot
 Disallow: /
 """
-    
-    response = make_response(robots_txt)
+
+@app.route('/robots.txt')
+def robots():
+    """Serve optimized robots.txt for search engine crawlers"""
+    response = make_response(ROBOTS_TXT)
     response.headers['Content-Type'] = 'text/plain; charset=utf-8'
     response.headers['Cache-Control'] = 'public, max-age=86400'
     return response
@@ -1404,7 +914,8 @@ def internal_error(e):
     return render_template('404.html'), 500
 
 if __name__ == "__main__":
-    # Check if running in production (Render, Heroku, etc.)
+    # Development server only; production runs under gunicorn (see wsgi.py).
+    # The debugger and reloader are opt-in with FLASK_DEBUG=1.
     port = int(os.environ.get('PORT', 5000))
-    debug = os.environ.get('FLASK_ENV') != 'production'
+    debug = os.environ.get('FLASK_DEBUG') == '1'
     app.run(host='0.0.0.0', port=port, debug=debug)
@@ -0,0 +1,18 @@
+# Convert the exported cosine similarity matrix into the format served by app.py
+#
+# app.py memory-maps cosine_similarity_matrix.npy, so each request only pages in
+# the single row it reads. float16 quarters the size of the float64 export while
+# keeping the top-10 recommendations virtually unchanged.
+#
+# Usage: python convert_similarity_matrix.py
+import joblib
+import numpy as np
+
+SOURCE = 'cosine_similarity_matrix.pkl'
+TARGET = 'cosine_similarity_matrix.npy'
+
+if __name__ == "__main__":
+    matrix = joblib.load(SOURCE)
+    matrix = np.ascontiguousarray(matrix, dtype=np.float16)
+    np.save(TARGET, matrix)
+    print(f"Saved {TARGET}: shape={matrix.shape}, dtype={matrix.dtype}, {matrix.nbytes / 1e6:.1f} MB")
@@ -0,0 +1,27 @@
+# Gunicorn settings for production
+#
+# Usage: gunicorn -c gunicorn.conf.py wsgi:application
+import gc
+import multiprocessing
+import os
+
+# Render (and most hosts) provide the port to listen on
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# One process per core, each with a few threads for I/O-bound requests
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Load app.py once in the master before forking, so workers share the parsed
+# dataset and indexes copy-on-write and map the same similarity matrix pages
+preload_app = True
+
+timeout = 30
+
+
+# Move everything loaded so far into the permanent generation before each
+# fork, so the workers' garbage collector never touches (and copies) the
+# shared pages holding the dataset, indexes and prerendered blog pages
+def pre_fork(server, worker):
+    gc.freeze()